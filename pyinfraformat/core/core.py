@@ -267,17 +267,18 @@ class Holes:
 
         Paramaters
         ----------
-        path : str
+        path : str or file object
         kwargs
             Passed to `pandas.DataFrame.to_csv` function.
         """
-        _, ext = os.path.splitext(path)
-        if ext not in (".txt", ".csv"):
-            msg = "Found extension {}, use '.csv' or '.txt'.".format(path)
-            logger.critical(msg)
-            raise FileExtensionMissingError(msg)
-        with open(path, "w") as f:
-            self.get_dataframe().to_csv(f, **kwargs)
+        if not hasattr(path, "write"):
+            _, ext = os.path.splitext(path)
+            if ext not in (".txt", ".csv"):
+                msg = "Found extension {}, use '.csv' or '.txt'.".format(path)
+                logger.critical(msg)
+                raise FileExtensionMissingError(msg)
+        # pandas opens the path itself with buffered writes and csv newline handling
+        self.get_dataframe().to_csv(path, **kwargs)
 
     def to_excel(self, path, **kwargs):
         """Save data in table format to Excel.
@@ -330,7 +331,15 @@ class Holes:
         else:
             to_infraformat(self.holes, path)
 
-    def plot_map(self, render_holes=True, progress_bar=True, popup_size=(3, 3)):
+    def plot_map(
+        self,
+        render_holes=True,
+        progress_bar=True,
+        popup_size=(3, 3),
+        n_jobs=1,
+        path=None,
+        basemaps=None,
+    ):
         """Plot a leaflet map from holes with popup hole plots.
 
         Parameters
@@ -342,14 +351,23 @@ class Holes:
             Show tqdm progress bar while adding/rendering holes
         popup_size : tuple
             size in inches of popup figure
+        n_jobs : int or None
+            Number of processes rendering popup diagrams, None or -1 uses all cpus.
+        path : str or path, optional
+            Save the map html to path and return None, large maps are then
+            not kept in memory or displayed in notebooks.
+        basemaps : str or list of str, optional
+            Names of the map layers added to the map, the first one is shown
+            initially. Possible values are the keys of
+            pyinfraformat.plots.maps.BASEMAPS, defaults to DEFAULT_BASEMAPS.
 
         Returns
         -------
-        map_fig : folium map object
+        map_fig : folium map object or None
         """
         from ..plots.maps import plot_map as _plot_map
 
-        return _plot_map(self, render_holes, progress_bar, popup_size)
+        return _plot_map(self, render_holes, progress_bar, popup_size, n_jobs, path, basemaps)
 
     def project(self, output="EPSG:4326", check="Finland", output_height=False):
         """Transform holes -objects coordinates.
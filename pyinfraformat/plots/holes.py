@@ -1,21 +1,27 @@
 """Plot diagrams for a single hole."""
-import gc
 import io
 import logging
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
 
 import matplotlib.dates as mdates
 import matplotlib.patches as patches
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from matplotlib.figure import Figure
 
-__all__ = ["plot_hole"]
+__all__ = ["plot_hole", "plot_many"]
 
 BBOX = dict(facecolor="white", alpha=0.75, edgecolor="none", boxstyle="round,pad=0.1")  # text boxes
 
 logger = logging.getLogger("pyinfraformat")
 
+FIGURE_TEMPLATES = {}  # pickled standalone figures by width ratios and rcParams, see get_subplots
+SVG_MAX_POINTS = 300  # svg diagrams are a few hundred pixels high, see decimate
+
 
 def strip_date(x):
     """Strip str date to datetime."""
@@ -32,6 +38,127 @@ def strip_date(x):
     return date
 
 
+def step_post(x, y):
+    """Return vertices of a post step line, same as ax.step(x, y, where="post").
+
+    Parameters
+    ----------
+    x, y : array_like
+
+    Returns
+    -------
+    x, y : ndarray
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    return np.repeat(x, 2)[1:], np.repeat(y, 2)[:-1]
+
+
+def decimate(values, depths, max_points=None):
+    """Downsample a series for display, keeping the minimum and maximum values.
+
+    The series is split into max_points // 2 buckets and the minimum and maximum
+    value of each bucket are kept together with the first and last sample.
+
+    Parameters
+    ----------
+    values, depths : array_like
+    max_points : int, optional
+        Approximate maximum number of samples kept, no downsampling if None.
+
+    Returns
+    -------
+    values, depths : ndarray
+    """
+    values = np.asarray(values, dtype=float)
+    depths = np.asarray(depths, dtype=float)
+    n_values = len(values)
+    if max_points is None or n_values <= max_points:
+        return values, depths
+    n_buckets = max(max_points // 2, 1)
+    size = -(-n_values // n_buckets)
+    padded = np.full(n_buckets * size, np.nan)
+    padded[:n_values] = values
+    padded = padded.reshape(n_buckets, size)
+    offsets = np.arange(n_buckets) * size
+    lows = offsets + np.argmin(np.where(np.isnan(padded), np.inf, padded), axis=1)
+    highs = offsets + np.argmax(np.where(np.isnan(padded), -np.inf, padded), axis=1)
+    keep = np.unique(np.concatenate(([0, n_values - 1], lows, highs)))
+    keep = keep[keep < n_values]
+    return values[keep], depths[keep]
+
+
+def divide_by_5(x):
+    """Scale blows axis values to the HP pressure axis."""
+    return x / 5
+
+
+def multiply_by_5(x):
+    """Scale HP pressure axis values to the blows axis."""
+    return x * 5
+
+
+def get_date_str(one_survey):
+    """Return survey date as a YYYY-MM-DD string."""
+    return one_survey.header.date.isoformat()[:10]
+
+
+def get_z_start_str(one_survey):
+    """Return survey start level as a signed string with two decimals."""
+    return "{:+.2f}".format(float(one_survey.header["XY"]["Z-start"]))
+
+
+def add_soil_labels(ax, depths, labels, x, **kwargs):
+    """Add soil type labels to an axis in one pass.
+
+    Parameters
+    ----------
+    ax : matplotlib axis
+    depths : array_like
+        Label y-positions in data coordinates.
+    labels : array_like
+        Soil type strings.
+    x : float
+        Label x-position in data coordinates.
+    **kwargs
+        Passed to ax.text.
+    """
+    for depth, label in zip(depths, labels):
+        ax.text(x, depth, s=label, bbox=BBOX, **kwargs)
+
+
+def get_subplots(width_ratios, pyplot=True):
+    """Create a figure with two side by side axes sharing the y-axis.
+
+    Parameters
+    ----------
+    width_ratios : list
+        Relative widths of the left and right axes.
+    pyplot : bool
+        Create the figure with pyplot. If False, create a standalone Figure
+        which is not registered to the pyplot figure manager. Standalone figures
+        are unpickled from a cached template, which is faster than building
+        the figure and axes from scratch. Templates are cached per rcParams, so
+        styles and rc_context are respected.
+
+    Returns
+    -------
+    fig : matplotlib figure
+    axes : tuple of matplotlib axes
+    """
+    gridspec_kw = {"wspace": 0, "width_ratios": width_ratios}
+    if pyplot:
+        return plt.subplots(1, 2, sharey=True, figsize=(4, 4), gridspec_kw=gridspec_kw)
+    # figures and axes take their defaults from rcParams when they are built
+    key = (tuple(width_ratios), repr(dict.items(plt.rcParams)))
+    if key not in FIGURE_TEMPLATES:
+        fig = Figure(figsize=(4, 4))
+        fig.subplots(1, 2, sharey=True, gridspec_kw=gridspec_kw)
+        FIGURE_TEMPLATES[key] = pickle.dumps(fig)
+    fig = pickle.loads(FIGURE_TEMPLATES[key])
+    return fig, tuple(fig.axes)
+
+
 def fig_to_hmtl(fig, clear_memory=True):
     """Transform matplotlib figure to html with mpld3.
 
@@ -39,6 +166,7 @@ def fig_to_hmtl(fig, clear_memory=True):
     ----------
     fig: matplotlib figure
     clear_memory: bool
+        Clear and close the figure after export.
 
     Returns
     -------
@@ -49,33 +177,35 @@ def fig_to_hmtl(fig, clear_memory=True):
     str_io.seek(0)
     if clear_memory:
         fig.clear()
-        plt.close()
-        gc.collect()
+        plt.close(fig)
     return str_io.read()
 
 
-def plot_po(one_survey):
+def plot_po(one_survey, pyplot=True, max_points=None):
     """Plot a diagram of PO (Porakonekairaus) with matplotlib.
 
     Parameters
     ----------
     one_survey : hole object
+    pyplot : bool
+        Create the figure with pyplot, else use a standalone matplotlib Figure.
+    max_points : int, optional
+        Downsample plotted series to about max_points samples, see decimate.
 
     Returns
     -------
     figure : matplotlib figure
     """
     df = pd.DataFrame(one_survey.survey.data)
+    depths = df["Depth (m)"].to_numpy(dtype=float)
     if "Soil type" in df.columns:  # pylint: disable=unsupported-membership-test
         soils = df.dropna(subset=["Soil type"])
     else:
         soils = None
 
-    fig, (ax_left, ax_right) = plt.subplots(
-        1, 2, sharey=True, figsize=(4, 4), gridspec_kw={"wspace": 0, "width_ratios": [2, 2]}
-    )
+    fig, (ax_left, ax_right) = get_subplots([2, 2], pyplot=pyplot)
     fig.set_figwidth(4)
-    ax_left.step(df["Time (s)"], df["Depth (m)"], where="post", c="k")
+    ax_left.plot(*step_post(*decimate(df["Time (s)"], depths, max_points)), c="k")
     ax_left.invert_yaxis()
     ax_left.spines["top"].set_visible(False)
     ax_left.spines["left"].set_visible(False)
@@ -87,43 +217,47 @@ def plot_po(one_survey):
     ax_right.spines["top"].set_visible(False)
     ax_right.spines["right"].set_visible(False)
     ax_right.spines["bottom"].set_visible(False)
-    ax_right.set_xticks([])
-    ax_right.set_title(one_survey.header.date.isoformat().split("T")[0])
-    ax_left.set_title("{:+.2f}".format(float(one_survey.header["XY"]["Z-start"])))
+    ax_right.set(xticks=[], title=get_date_str(one_survey))
+    ax_left.set_title(get_z_start_str(one_survey))
     ymax_atleast = 5  # hard limit minimum for aestics
     ymax = max(ymax_atleast, ax_right.get_ylim()[0])
     ax_right.set_ylim(ymax, 0)
 
     if soils is not None:
-        for _, row in soils.iterrows():
-            ax_right.text(0.03, row["Depth (m)"], s=row["Soil type"], bbox=BBOX)
+        add_soil_labels(
+            ax_right, soils["Depth (m)"].to_numpy(), soils["Soil type"].to_numpy(), 0.03
+        )
 
-    last = df["Depth (m)"].iloc[-1]
+    last = depths[-1]
     # ax_right.plot(0, last, marker="_", zorder=10, clip_on=False, ms=20, c="k")
     if hasattr(one_survey.header, "-1") and "Ending" in one_survey.header["-1"]:
         ax_right.text(0.03, last, s=one_survey.header["-1"]["Ending"], va="top", bbox=BBOX)
     return fig
 
 
-def plot_pa(one_survey):
+def plot_pa(one_survey, pyplot=True, max_points=None):
     """Plot a diagram of PA (Painokairaus) with matplotlib.
 
     Parameters
     ----------
     one_survey : hole object
+    pyplot : bool
+        Create the figure with pyplot, else use a standalone matplotlib Figure.
+    max_points : int, optional
+        Downsample plotted series to about max_points samples, see decimate.
 
     Returns
     -------
     figure : matplotlib figure
     """
     df = pd.DataFrame(one_survey.survey.data)
-    df.loc[df["Load (kN)"] >= 100, "Load (kN)"] = 0
+    depths = df["Depth (m)"].to_numpy(dtype=float)
+    load = df["Load (kN)"].to_numpy(dtype=float, copy=True)
+    load[load >= 100] = 0
 
-    fig, (ax_left, ax_right) = plt.subplots(
-        1, 2, sharey=True, figsize=(4, 4), gridspec_kw={"wspace": 0, "width_ratios": [1, 3]}
-    )
+    fig, (ax_left, ax_right) = get_subplots([1, 3], pyplot=pyplot)
     fig.set_figwidth(4)
-    ax_left.step(df["Load (kN)"], df["Depth (m)"], where="post", c="k")
+    ax_left.plot(*step_post(*decimate(load, depths, max_points)), c="k")
     ax_left.invert_yaxis()
     ax_left.spines["top"].set_visible(False)
     ax_left.spines["left"].set_visible(False)
@@ -132,42 +266,45 @@ def plot_pa(one_survey):
     plt.setp(ax_left.get_yticklabels(), visible=False)
 
     ax_left.set_xlim([100, 0])
-    ax_right.step(df["Rotation of half turns (-)"], df["Depth (m)"], where="post", c="k")
+    rotations = df["Rotation of half turns (-)"]
+    ax_right.plot(*step_post(*decimate(rotations, depths, max_points)), c="k")
     ax_right.yaxis.set_tick_params(which="both", labelbottom=True)
     ax_right.spines["top"].set_visible(False)
     ax_right.spines["right"].set_visible(False)
-    ax_right.set_xlim([0, 110])
-    ax_right.set_title(one_survey.header.date.isoformat().split("T")[0])
-    ax_left.set_title("{:+.2f}".format(float(one_survey.header["XY"]["Z-start"])))
+    ax_right.set(xlim=[0, 110], title=get_date_str(one_survey))
+    ax_left.set_title(get_z_start_str(one_survey))
     ymax_atleast = 5  # hard limit minimum for aestics
     ymax = max(ymax_atleast, ax_right.get_ylim()[0])
     ax_right.set_ylim(ymax, 0)
 
-    last = df["Depth (m)"].iloc[-1]
+    last = depths[-1]
     ax_right.plot(0, last, marker="_", zorder=10, clip_on=False, ms=20, c="k")
     if hasattr(one_survey.header, "-1") and "Ending" in one_survey.header["-1"]:
         ax_right.text(8, last, s=one_survey.header["-1"]["Ending"], va="top", bbox=BBOX)
     return fig
 
 
-def plot_hp(one_survey):
+def plot_hp(one_survey, pyplot=True, max_points=None):
     """Plot a diagram of HP (Puristinheijarikairaus) with matplotlib.
 
     Parameters
     ----------
     one_survey : hole object
+    pyplot : bool
+        Create the figure with pyplot, else use a standalone matplotlib Figure.
+    max_points : int, optional
+        Downsample plotted series to about max_points samples, see decimate.
 
     Returns
     -------
     figure : matplotlib figure
     """
     df = pd.DataFrame(one_survey.survey.data)
+    depths = df["Depth (m)"].to_numpy(dtype=float)
 
-    fig, (ax_left, ax_right) = plt.subplots(
-        1, 2, sharey=True, figsize=(4, 4), gridspec_kw={"wspace": 0, "width_ratios": [1, 3]}
-    )
+    fig, (ax_left, ax_right) = get_subplots([1, 3], pyplot=pyplot)
     fig.set_figwidth(4)
-    ax_left.plot(df["Torque (Nm)"], df["Depth (m)"], c="k")
+    ax_left.plot(*decimate(df["Torque (Nm)"], depths, max_points), c="k")
     ax_left.invert_yaxis()
     ax_left.spines["top"].set_visible(False)
     ax_left.spines["left"].set_visible(False)
@@ -175,62 +312,66 @@ def plot_hp(one_survey):
 
     plt.setp(ax_left.get_yticklabels(), visible=False)
 
-    ax_left.set_xlim([200, 0])
-    ax_left.set_xticks([200, 100, 0])
+    ax_left.set(xlim=[200, 0], xticks=[200, 100, 0])
     ax_right.barh(
-        [0] + list(df["Depth (m)"])[:-1],
-        df["Blows"],
+        np.concatenate(([0.0], depths[:-1])),
+        df["Blows"].to_numpy(),
         align="edge",
         fill=False,
-        height=df["Depth (m)"].diff(periods=1),
+        height=np.diff(depths, prepend=np.nan),
         linewidth=1.5,
     )
     if "Pressure (MN/m^2)" in df.columns:
-        ax_right.plot(df["Pressure (MN/m^2)"] * 5, df["Depth (m)"], c="k")
+        pressures, pressure_depths = decimate(df["Pressure (MN/m^2)"], depths, max_points)
+        ax_right.plot(pressures * 5, pressure_depths, c="k")
 
     ax_right.yaxis.set_tick_params(which="both", labelbottom=True)
 
-    ax_right.set_xlim([0, 110])
-    ax_right.set_xticks(list(range(0, 120, 20)))
+    ax_right.set(xlim=[0, 110], xticks=list(range(0, 120, 20)))
     ymax_atleast = 5  # hard limit minimum for aestics
     ymax = max(ymax_atleast, ax_right.get_ylim()[0])
     ax_right.set_ylim(ymax, 0)
 
-    locs = ax_right.get_xticks()
-    y_min, y_max = ax_right.get_ylim()
-    y = y_min + (y_max - y_min) * 0.005
-    for x in locs[1:]:
-        ax_right.text(x, y, s="{:.0f}".format(x / 5), ha="center", va="bottom")
+    # pressure scale (MN/m^2) drawn inside the axis above the blows ticks
+    pressure_axis = ax_right.secondary_xaxis("bottom", functions=(divide_by_5, multiply_by_5))
+    pressure_axis.set_xticks(ax_right.get_xticks()[1:] / 5)
+    pressure_axis.xaxis.set_major_formatter("{x:.0f}")
+    pressure_axis.tick_params(length=0, pad=-12)
+    pressure_axis.spines["bottom"].set_visible(False)
 
     ax_right.spines["top"].set_visible(False)
     ax_right.spines["right"].set_visible(False)
 
-    ax_right.set_title(one_survey.header.date.isoformat().split("T")[0])
-    ax_left.set_title("{:+.2f}".format(float(one_survey.header["XY"]["Z-start"])))
+    ax_right.set_title(get_date_str(one_survey))
+    ax_left.set_title(get_z_start_str(one_survey))
 
-    last = df["Depth (m)"].iloc[-1]
+    last = depths[-1]
     ax_right.plot(0, last, marker="_", zorder=10, clip_on=False, ms=20, c="k")
     if hasattr(one_survey.header, "-1") and "Ending" in one_survey.header["-1"]:
         ax_right.text(3, last, s=one_survey.header["-1"]["Ending"], va="top", bbox=BBOX)
     return fig
 
 
-def plot_si(one_survey):
+def plot_si(one_survey, pyplot=True, max_points=None):  # pylint: disable=unused-argument
     """Plot a diagram of SI (Siipikairaus) with matplotlib.
 
     Parameters
     ----------
     one_survey : hole object
+    pyplot : bool
+        Create the figure with pyplot, else use a standalone matplotlib Figure.
+    max_points : int, optional
+        Accepted for a uniform signature, the diagram is not downsampled.
 
     Returns
     -------
     figure : matplotlib figure
     """
     df = pd.DataFrame(one_survey.survey.data)
+    depths = df["Depth (m)"].to_numpy(dtype=float)
+    strengths = df["Shear strength (kN/m^2)"].to_numpy(dtype=float)
 
-    fig, (ax_left, ax_right) = plt.subplots(
-        1, 2, sharey=True, figsize=(4, 4), gridspec_kw={"wspace": 0, "width_ratios": [0.5, 3]}
-    )
+    fig, (ax_left, ax_right) = get_subplots([0.5, 3], pyplot=pyplot)
     fig.set_figwidth(4)
     ax_left.invert_yaxis()
     ax_left.spines["top"].set_visible(False)
@@ -241,55 +382,56 @@ def plot_si(one_survey):
     plt.setp(ax_left.get_yticklabels(), visible=False)
     ax_left.set_xlim([100, 0])
 
-    for i in range(len(df) - 1):
-        depth = list(df.iloc[[i, i + 1]]["Depth (m)"])
-        depth.insert(0, depth[0])
-        depth.append(depth[-1])
-        strength = list(df.iloc[[i, i + 1]]["Shear strength (kN/m^2)"])
-        strength.insert(0, 0)
-        strength.append(0)
+    for i in range(len(depths) - 1):
+        depth = [depths[i], depths[i], depths[i + 1], depths[i + 1]]
+        strength = [0, strengths[i], strengths[i + 1], 0]
         ax_right.plot(strength, depth, c="k")
 
-    ax_right.plot(df["Residual Shear strength (kN/m^2)"], df["Depth (m)"], c="k", ls="--")
+    ax_right.plot(df["Residual Shear strength (kN/m^2)"], depths, c="k", ls="--")
     ax_right.yaxis.set_tick_params(which="both", labelbottom=True)
     ax_right.spines["top"].set_visible(False)
     ax_right.spines["right"].set_visible(False)
-    x_max = int(max([60, max(df["Shear strength (kN/m^2)"]) + 10]))
-    ax_right.set_xlim([0, x_max])
-    ax_right.set_xticks(list(range(0, x_max, (10 if x_max < 60 else 20))))
-    ax_right.set_title(one_survey.header.date.isoformat().split("T")[0])
-    ax_left.set_title("{:+.2f}".format(float(one_survey.header["XY"]["Z-start"])))
+    x_max = int(max([60, max(strengths) + 10]))
+    ax_right.set(
+        xlim=[0, x_max],
+        xticks=list(range(0, x_max, (10 if x_max < 60 else 20))),
+        title=get_date_str(one_survey),
+    )
+    ax_left.set_title(get_z_start_str(one_survey))
     ymax_atleast = 5  # hard limit minimum for aestics
     ymax = max(ymax_atleast, ax_right.get_ylim()[0])
     ax_right.set_ylim(ymax, 0)
 
-    last = df["Depth (m)"].iloc[-1]
+    last = depths[-1]
     ax_right.plot(0, last, marker="_", zorder=10, clip_on=False, ms=20, c="k")
     if hasattr(one_survey.header, "-1") and "Ending" in one_survey.header["-1"]:
         ax_right.text(3, last, s=one_survey.header["-1"]["Ending"], va="top", bbox=BBOX)
     return fig
 
 
-def plot_tr(one_survey):
+def plot_tr(one_survey, pyplot=True, max_points=None):  # pylint: disable=unused-argument
     """Plot a diagram of TR (Tärykairaus) with matplotlib.
 
     Parameters
     ----------
     one_survey : hole object
+    pyplot : bool
+        Create the figure with pyplot, else use a standalone matplotlib Figure.
+    max_points : int, optional
+        Accepted for a uniform signature, the diagram is not downsampled.
 
     Returns
     -------
     figure : matplotlib figure
     """
     df = pd.DataFrame(one_survey.survey.data)
+    depths = df["Depth (m)"].to_numpy(dtype=float)
     if "Soil type" in df.columns:  # pylint: disable=unsupported-membership-test
         soils = df.dropna(subset=["Soil type"])
     else:
         soils = None
 
-    fig, (ax_left, ax_right) = plt.subplots(
-        1, 2, sharey=True, figsize=(4, 4), gridspec_kw={"wspace": 0, "width_ratios": [2, 2]}
-    )
+    fig, (ax_left, ax_right) = get_subplots([2, 2], pyplot=pyplot)
     fig.set_figwidth(4)
     ax_left.invert_yaxis()
     ax_left.spines["top"].set_visible(False)
@@ -303,19 +445,22 @@ def plot_tr(one_survey):
     ax_right.spines["top"].set_visible(False)
     ax_right.spines["right"].set_visible(False)
     ax_right.spines["bottom"].set_visible(False)
-    ax_right.set_xlim(0, 1)
-    ax_right.set_xticks([])
-    ax_right.set_title(one_survey.header.date.isoformat().split("T")[0])
-    ax_left.set_title("{:+.2f}".format(float(one_survey.header["XY"]["Z-start"])))
+    ax_right.set(xlim=[0, 1], xticks=[], title=get_date_str(one_survey))
+    ax_left.set_title(get_z_start_str(one_survey))
     ymax_atleast = 5  # hard limit minimum for aestics
-    ymax = max(ymax_atleast, df["Depth (m)"].iloc[-1])
+    ymax = max(ymax_atleast, depths[-1])
     ax_right.set_ylim(ymax, 0)
 
     if soils is not None:
-        for _, row in soils.iterrows():
-            ax_right.text(0.03, row["Depth (m)"], s=row["Soil type"], va="bottom", bbox=BBOX)
+        add_soil_labels(
+            ax_right,
+            soils["Depth (m)"].to_numpy(),
+            soils["Soil type"].to_numpy(),
+            0.03,
+            va="bottom",
+        )
 
-    last = df["Depth (m)"].iloc[-1]
+    last = depths[-1]
     ax_right.plot(0, last, marker="_", zorder=10, clip_on=False, ms=20, c="k")
     if hasattr(one_survey.header, "-1") and "Ending" in one_survey.header["-1"]:
         ax_right.text(0.10, last, s=one_survey.header["-1"]["Ending"], va="top", bbox=BBOX)
@@ -323,25 +468,28 @@ def plot_tr(one_survey):
     return fig
 
 
-def plot_he(one_survey):
+def plot_he(one_survey, pyplot=True, max_points=None):
     """Plot a diagram of HE (Heijarikairaus) with matplotlib.
 
     Parameters
     ----------
     one_survey : hole object
+    pyplot : bool
+        Create the figure with pyplot, else use a standalone matplotlib Figure.
+    max_points : int, optional
+        Downsample plotted series to about max_points samples, see decimate.
 
     Returns
     -------
     figure : matplotlib figure
     """
     df = pd.DataFrame(one_survey.survey.data)
+    depths = df["Depth (m)"].to_numpy(dtype=float)
     if "Soil type" in df.columns:  # pylint: disable=unsupported-membership-test
         soils = df.dropna(subset=["Soil type"])
     else:
         soils = None
-    fig, (ax_left, ax_right) = plt.subplots(
-        1, 2, sharey=True, figsize=(4, 4), gridspec_kw={"wspace": 0, "width_ratios": [1, 3]}
-    )
+    fig, (ax_left, ax_right) = get_subplots([1, 3], pyplot=pyplot)
     fig.set_figwidth(4)
     ax_left.invert_yaxis()
     ax_left.spines["top"].set_visible(False)
@@ -350,16 +498,15 @@ def plot_he(one_survey):
     plt.setp(ax_left.get_yticklabels(), visible=False)
     ax_left.set_xticks([])
     ax_right.barh(
-        [0] + list(df["Depth (m)"])[:-1],
-        df["Blows"],
+        np.concatenate(([0.0], depths[:-1])),
+        df["Blows"].to_numpy(),
         align="edge",
         fill=False,
-        height=df["Depth (m)"].diff(periods=1),
+        height=np.diff(depths, prepend=np.nan),
         linewidth=1.5,
     )
     ax_right.yaxis.set_tick_params(which="both", labelbottom=True)
-    ax_right.set_xlim([0, 110])
-    ax_right.set_xticks(list(range(0, 120, 20)))
+    ax_right.set(xlim=[0, 110], xticks=list(range(0, 120, 20)))
     ymax_atleast = 5  # hard limit minimum for aestics
     ymax = max(ax_right.get_ylim()[0], ymax_atleast)
     ax_right.set_ylim(ymax, 0)
@@ -367,27 +514,30 @@ def plot_he(one_survey):
     ax_right.spines["top"].set_visible(False)
     ax_right.spines["right"].set_visible(False)
 
-    ax_right.set_title(one_survey.header.date.isoformat().split("T")[0])
-    ax_left.set_title("{:+.2f}".format(float(one_survey.header["XY"]["Z-start"])))
+    ax_right.set_title(get_date_str(one_survey))
+    ax_left.set_title(get_z_start_str(one_survey))
 
-    last = df["Depth (m)"].iloc[-1]
+    last = depths[-1]
     ax_right.plot(0, last, marker="_", zorder=10, clip_on=False, ms=20, c="k")
     if hasattr(one_survey.header, "-1") and "Ending" in one_survey.header["-1"]:
         ax_right.text(8, last, s=one_survey.header["-1"]["Ending"], va="top", bbox=BBOX)
 
     if soils is not None:
-        for _, row in soils.iterrows():
-            ax_right.text(3, row["Depth (m)"], s=row["Soil type"], bbox=BBOX)
+        add_soil_labels(ax_right, soils["Depth (m)"].to_numpy(), soils["Soil type"].to_numpy(), 3)
 
     return fig
 
 
-def plot_vp(one_survey):
+def plot_vp(one_survey, pyplot=True, max_points=None):  # pylint: disable=unused-argument
     """Plot a diagram of VP (Pohjavesiputki) or VO (Orsivesiptki) with matplotlib.
 
     Parameters
     ----------
     one_survey : hole object
+    pyplot : bool
+        Create the figure with pyplot, else use a standalone matplotlib Figure.
+    max_points : int, optional
+        Accepted for a uniform signature, the diagram is not downsampled.
 
     Returns
     -------
@@ -401,9 +551,7 @@ def plot_vp(one_survey):
     sieve_length = df["Lenght of the sieve(m)"][0]
 
     dates = df["Date"].apply(strip_date)
-    fig, (ax_left, ax_right) = plt.subplots(
-        1, 2, sharey=True, figsize=(4, 4), gridspec_kw={"wspace": 0, "width_ratios": [1, 3]}
-    )
+    fig, (ax_left, ax_right) = get_subplots([1, 3], pyplot=pyplot)
 
     rect_sieve = patches.Rectangle(
         (0.45, bottom_level), width=0.2, height=sieve_length, linewidth=1, fill=None, hatch="///"
@@ -450,7 +598,7 @@ def plot_vp(one_survey):
             ax_right.set_xticks(range(len(dates)))
     else:
         ax_right.plot(dates, df["Water level"], "o-")
-        ax_right.set_title(one_survey.header.date.isoformat().split("T")[0])
+        ax_right.set_title(get_date_str(one_survey))
         ax_right.set_xticks(np.linspace(*ax_right.get_xlim(), 3))
         ax_right.set_xticklabels(
             [mdates.num2date(label).isoformat()[:10] for label in ax_right.get_xticks()]
@@ -458,7 +606,19 @@ def plot_vp(one_survey):
     return fig
 
 
-def plot_hole(one_survey, output="figure", figsize=(4, 4)):
+PLOT_FUNCTIONS = {
+    "PO": plot_po,
+    "PA": plot_pa,
+    "HP": plot_hp,
+    "SI": plot_si,
+    "TR": plot_tr,
+    "HE": plot_he,
+    "VP": plot_vp,
+    "VO": plot_vp,
+}
+
+
+def plot_hole(one_survey, output="figure", figsize=(4, 4), pyplot=None):
     """Plot a diagram of a sounding with matplotlib.
 
     Parameters
@@ -468,6 +628,10 @@ def plot_hole(one_survey, output="figure", figsize=(4, 4)):
         Possible values: ['figure', 'svg']
     figsize : tuple
         figure size in inches
+    pyplot : bool, optional
+        Create the figure with pyplot, else use a standalone matplotlib Figure
+        which is freed when it is no longer referenced. Defaults to True for
+        figure output and False for svg output.
 
     Returns
     -------
@@ -478,39 +642,107 @@ def plot_hole(one_survey, output="figure", figsize=(4, 4)):
         hole_type = one_survey.header["TT"]["Survey abbreviation"]
 
         if len(one_survey.survey.data) == 0:
-            fig = plt.figure()
-        elif hole_type == "PO":
-            fig = plot_po(one_survey)
-        elif hole_type == "PA":
-            fig = plot_pa(one_survey)
-        elif hole_type == "HP":
-            fig = plot_hp(one_survey)
-        elif hole_type == "SI":
-            fig = plot_si(one_survey)
-        elif hole_type == "TR":
-            fig = plot_tr(one_survey)
-        elif hole_type == "HE":
-            fig = plot_he(one_survey)
-        elif hole_type == "VP":
-            fig = plot_vp(one_survey)
-        elif hole_type == "VO":
-            fig = plot_vp(one_survey)
+            fig = plt.figure() if pyplot else Figure()
+        elif hole_type in PLOT_FUNCTIONS:
+            fig = PLOT_FUNCTIONS[hole_type](one_survey, pyplot=pyplot, max_points=max_points)
         else:
             raise NotImplementedError('Hole object "{}" not supported'.format(hole_type))
         fig.tight_layout()
         fig.set_size_inches(figsize)
         return fig
 
+    # svg output is serialized right away, skip the pyplot figure manager
+    if pyplot is None:
+        pyplot = output != "svg"
+    # svg diagrams are small, plotting more samples than pixels only grows the svg
+    max_points = SVG_MAX_POINTS if output == "svg" else None
     try:
         fig = _plot_hole(one_survey)
     except (KeyError, TypeError) as error:
         logger.warning("Data missing, check hole. %s", error)
-        plt.close()
+        if pyplot:
+            plt.close()
         raise
 
     if output == "figure":
         return fig
     elif output == "svg":
-        return fig_to_hmtl(fig)
+        # pyplot figures are closed after export, standalone figures are freed with fig
+        return fig_to_hmtl(fig, clear_memory=pyplot)
     else:
         raise NotImplementedError("Plotting backend {} not implemented".format(output))
+
+
+def plot_hole_or_none(one_survey, output="svg", figsize=(4, 4), pyplot=None):
+    """Plot a diagram of a sounding, None if the hole can not be plotted."""
+    try:
+        return plot_hole(one_survey, output=output, figsize=figsize, pyplot=pyplot)
+    except (NotImplementedError, KeyError, TypeError):
+        return None
+
+
+def get_plot_key(one_survey):
+    """Return key of a hole diagram, holes with equal keys have identical diagrams."""
+    return str(one_survey.header), str(one_survey.survey.data)
+
+
+def plot_many(holes, output="svg", figsize=(4, 4), n_jobs=1):
+    """Plot diagrams of many soundings with matplotlib.
+
+    Figures are unpickled from shared layout templates and never registered to
+    pyplot, so the cost of building a figure is paid once per layout and figures
+    are freed when they are no longer referenced. Svg output is rendered once for
+    holes with identical header and data.
+
+    Parameters
+    ----------
+    holes : holes object or iterable of hole objects
+    output : str
+        Possible values: ['figure', 'svg']
+    figsize : tuple
+        figure size in inches
+    n_jobs : int or None
+        Number of processes rendering svg output, None or -1 uses all cpus.
+        Parallel rendering is available only for svg output.
+
+    Returns
+    -------
+    iterator of figure, svg or None
+        Lazy iterator in the order of holes, plots are created while it is consumed.
+        Figures are standalone matplotlib Figures. None for holes which can not
+        be plotted.
+    """
+    plot_func = partial(plot_hole_or_none, output=output, figsize=figsize, pyplot=False)
+    if output != "svg":
+        if n_jobs != 1:
+            raise ValueError("Parallel plotting is implemented only for svg output")
+        return map(plot_func, holes)
+    if n_jobs == 1:
+        return plot_unique(plot_func, holes)
+    max_workers = None if n_jobs in (None, -1) else n_jobs
+    return plot_parallel(plot_func, holes, max_workers)
+
+
+def plot_unique(plot_func, holes):
+    """Yield plot_func results for holes, holes with equal plot keys are plotted once."""
+    plots = {}
+    for one_survey in holes:
+        key = get_plot_key(one_survey)
+        if key not in plots:
+            plots[key] = plot_func(one_survey)
+        yield plots[key]
+
+
+def plot_parallel(plot_func, holes, max_workers=None):
+    """Yield plot_func results for holes computed in a process pool.
+
+    Holes with equal plot keys are plotted once.
+    """
+    holes = list(holes)
+    keys = [get_plot_key(one_survey) for one_survey in holes]
+    unique_holes = dict(zip(keys, holes))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        plots = executor.map(plot_func, unique_holes.values(), chunksize=16)
+        plots = dict(zip(unique_holes, plots))
+    for key in keys:
+        yield plots[key]
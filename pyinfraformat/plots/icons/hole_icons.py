@@ -1,13 +1,13 @@
 """Create hole icons {abbreviation}.svg.
 
-Creates to current path svg files with svgwrite.
+Creates to current path svg files, icons are written as plain svg strings.
 Change Globals for options like icon size and stroke width.
 Large icons are streched with STRECH_LARGE, some figures
 are heigher/wider by stroke width not to cut line edges.
 
 Options
 -------
-DRAWING_SIZE = np.array([25.0, 25.0])  # Must be isotropic and float
+DRAWING_SIZE = (25.0, 25.0)  # Must be isotropic and float
 STROKE_WIDTH = 1
 STRECH_LARGE = 1.5  #ex. Näytteenotto
 HIGH_ICONS_HEIGHT_STRECH = 2  #ex. Pohjavesiputki
@@ -16,16 +16,40 @@ HIGH_ICONS_HEIGHT_STRECH = 2  #ex. Pohjavesiputki
 FUNCTIONS : dict
     {abbreviation : function}
 
+get_icon_svg(abbreviation) returns the cached svg string of an icon.
 run main() for creation.
 
 """
-import numpy as np
-import svgwrite
+import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 
-DRAWING_SIZE = np.array([25.0, 25.0])  # Must be isotropic and float
+DRAWING_SIZE = (25.0, 25.0)  # Must be isotropic and float
 STROKE_WIDTH = 1.5
 STRECH_LARGE = 1.5  # ex. Näytteenotto
 HIGH_ICONS_HEIGHT_STRECH = 2  # ex. Pohjavesiputki
+XML_HEADER = '<?xml version="1.0" encoding="utf-8" ?>\n'
+ICONS_FILE = "icons.json"  # {abbreviation: svg} of all icons
+
+# Shared geometry, computed once
+CENTER = (DRAWING_SIZE[0] / 2, DRAWING_SIZE[1] / 2)
+OUTER_RADIUS = DRAWING_SIZE[0] / 2 - STROKE_WIDTH / 2  # circle touching the drawing edges
+COS30 = 3**0.5 / 2
+TRIANGLE_SIDE = COS30 * DRAWING_SIZE[0]  # kolmion sivu
+TRIANGLE_POINTS = [
+    (DRAWING_SIZE[0] / 2, DRAWING_SIZE[1]),
+    ((DRAWING_SIZE[0] - TRIANGLE_SIDE) / 2, DRAWING_SIZE[1] - 1.5 * DRAWING_SIZE[0] / 2),
+    (
+        DRAWING_SIZE[0] - (DRAWING_SIZE[0] - TRIANGLE_SIDE) / 2,
+        DRAWING_SIZE[1] - 1.5 * DRAWING_SIZE[0] / 2,
+    ),
+]
+TRIANGLE_INNER_RADIUS = COS30 * (TRIANGLE_SIDE / 3)
+TRIANGLE_DRAWING_SIZE = (DRAWING_SIZE[0], DRAWING_SIZE[1] + STROKE_WIDTH)  # room for the tip
+DIST_TO_MID = (2**0.5) * DRAWING_SIZE[0] / 2
+LARGE_SIZE = (DRAWING_SIZE[0] * STRECH_LARGE, DRAWING_SIZE[1] * STRECH_LARGE)
+LARGE_CENTER = (LARGE_SIZE[0] / 2, LARGE_SIZE[1] / 2)
 
 ABBREVIATIONS = {
     "CP": "CPT -kairaus",
@@ -72,448 +96,252 @@ ABBREVIATIONS = {
 
 def get_arc_command(point1, point2, radius, sweep=0):
     """Command for creating arc in svg."""
-    args = {
-        "x0": point1[0],
-        "y0": point1[1],
-        "xradius": radius,
-        "yradius": radius,
-        "ellipseRotation": 0,  # has no effect for circles,
-        "sweep": int(bool(sweep)),
-        "x1": (point2[0] - point1[0]),
-        "y1": (point2[1] - point1[1]),
-    }
-    return (
-        "M %(x0)f,%(y0)f a %(xradius)f,%(yradius)f %(ellipseRotation)f 0,%(sweep)d %(x1)f,%(y1)f"
-        % args
+    x0, y0 = point1[0], point1[1]
+    dx, dy = point2[0] - x0, point2[1] - y0
+    sweep = 1 if sweep else 0
+    # ellipse rotation 0.000000 has no effect for circles
+    return f"M {x0:f},{y0:f} a {radius:f},{radius:f} 0.000000 0,{sweep} {dx:f},{dy:f}"
+
+
+def get_element(tag, **attribs):
+    """Return svg element string, attributes are sorted and underscores written as dashes."""
+    attribs = " ".join(
+        '{}="{}"'.format(key.replace("_", "-"), value) for key, value in sorted(attribs.items())
     )
+    return "<{} {} />".format(tag, attribs)
+
+
+def get_drawing(size, elements):
+    """Return svg document string of given size containing the elements."""
+    return (
+        '<svg baseProfile="full" height="{height}" version="1.1" width="{width}" '
+        'xmlns="http://www.w3.org/2000/svg" xmlns:ev="http://www.w3.org/2001/xml-events" '
+        'xmlns:xlink="http://www.w3.org/1999/xlink"><defs />{elements}</svg>'
+    ).format(width=size[0], height=size[1], elements="".join(elements))
+
+
+def get_path(command, width=3, stroke="black", fill="black"):
+    """Return a path -object from svg path command."""
+    return get_element("path", d=command, fill=fill, stroke=stroke, stroke_width=width)
 
 
 def get_arc(point1, point2, radius, width=3, stroke="black", fill="black", sweep=0):
     """Return an path -object that bulges to the right (sweep=0) or left (sweep=1)."""
     command = get_arc_command(point1, point2, radius, sweep=sweep)
-    path = svgwrite.path.Path(
-        d=command,
-        fill=fill,
-        stroke=stroke,
-        stroke_width=width,
-    )
-    return path
+    return get_path(command, width=width, stroke=stroke, fill=fill)
 
 
-def po_icon():
-    """Icon for porakonekairaus."""
-    dwg = svgwrite.Drawing(size=DRAWING_SIZE.tolist())
-    radius = DRAWING_SIZE[0] / 2 - STROKE_WIDTH / 2
-    shp = svgwrite.shapes.Circle(
-        center=(DRAWING_SIZE / 2).tolist(),
+def get_circle(center, radius, fill="none"):
+    """Return a circle -object with the icon stroke."""
+    return get_element(
+        "circle",
+        cx=center[0],
+        cy=center[1],
         r=radius,
-        fill="none",
+        fill=fill,
         stroke="black",
         stroke_width=STROKE_WIDTH,
     )
-    dwg.add(shp)
-    return dwg
 
 
-def tr_icon():
-    """Icon for tärykaiaus."""
-    dwg = svgwrite.Drawing(size=DRAWING_SIZE.tolist())
-    radius = DRAWING_SIZE[0] / 2 - STROKE_WIDTH / 2
-    shp = svgwrite.shapes.Circle(
-        center=(DRAWING_SIZE / 2).tolist(),
-        r=radius,
-        fill="none",
+def get_line(start, end):
+    """Return a line -object with the icon stroke."""
+    return get_element(
+        "line",
+        x1=start[0],
+        y1=start[1],
+        x2=end[0],
+        y2=end[1],
         stroke="black",
         stroke_width=STROKE_WIDTH,
     )
 
-    start = (DRAWING_SIZE[0] / 2, 0)
-    end = (DRAWING_SIZE[0] / 2, DRAWING_SIZE[1])
-    line1 = svgwrite.shapes.Line(start=start, end=end, stroke_width=STROKE_WIDTH, stroke="black")
 
-    start = (0, DRAWING_SIZE[1] / 2)
-    end = (DRAWING_SIZE[0], DRAWING_SIZE[1] / 2)
-    line2 = svgwrite.shapes.Line(start=start, end=end, stroke_width=STROKE_WIDTH, stroke="black")
+def get_polygon(points):
+    """Return a polygon -object with the icon stroke."""
+    points = " ".join("{},{}".format(x, y) for x, y in points)
+    return get_element(
+        "polygon", points=points, fill="none", stroke="black", stroke_width=STROKE_WIDTH
+    )
+
+
+def get_filled_quadrant(center, radius):
+    """Return a path -object filling the upper left quarter of a circle."""
+    point1 = (center[0] - radius, center[1])
+    point2 = (center[0], center[1] - radius)
+    command = get_arc_command(point2, point1, radius)
+    command += " L {} {}".format(center[0], center[1])
+    return get_path(command, width=1e-5, fill="black")
+
+
+def po_icon():
+    """Icon for porakonekairaus."""
+    shp = get_circle(CENTER, OUTER_RADIUS)
+    return get_drawing(DRAWING_SIZE, [shp])
+
+
+def tr_icon():
+    """Icon for tärykaiaus."""
+    shp = get_circle(CENTER, OUTER_RADIUS)
+
+    line1 = get_line((CENTER[0], 0), (CENTER[0], DRAWING_SIZE[1]))
+    line2 = get_line((0, CENTER[1]), (DRAWING_SIZE[0], CENTER[1]))
 
-    dwg.add(line1)
-    dwg.add(line2)
-    dwg.add(shp)
-    return dwg
+    return get_drawing(DRAWING_SIZE, [line1, line2, shp])
 
 
 def pa_icon():
     """Icon for painokairaus."""
-    dwg = svgwrite.Drawing(size=DRAWING_SIZE.tolist())
-    radius = DRAWING_SIZE[0] / 2 - STROKE_WIDTH / 2
-    shp = svgwrite.shapes.Circle(
-        center=(DRAWING_SIZE / 2).tolist(),
-        r=radius,
-        fill="none",
-        stroke="black",
-        stroke_width=STROKE_WIDTH,
-    )
+    shp = get_circle(CENTER, OUTER_RADIUS)
 
     arc = get_arc(
-        (0, DRAWING_SIZE[1] / 2),
-        (DRAWING_SIZE[0], DRAWING_SIZE[1] / 2),
-        radius=radius,
+        (0, CENTER[1]),
+        (DRAWING_SIZE[0], CENTER[1]),
+        radius=OUTER_RADIUS,
         width=0,
         stroke="none",
     )
-    dwg.add(arc)
-    dwg.add(shp)
-    return dwg
+    return get_drawing(DRAWING_SIZE, [arc, shp])
 
 
 def pr_icon():
     """Icon for puristinkairaus."""
-    dwg = svgwrite.Drawing(size=DRAWING_SIZE.tolist())
     # radius = DRAWING_SIZE[0] / 2  # - STROKE_WIDTH / 2
     # radius=1
-    # circle = svgwrite.shapes.Circle(
-    #    center=(DRAWING_SIZE / 2).tolist(),
-    #    r=radius,
-    #    fill="none",
-    #    stroke="black",
-    #    stroke_width=STROKE_WIDTH,
-    # )
-    # dwg.add(circle)  #Helper circle
-
-    cos30 = 3**0.5 / 2
-    radius = DRAWING_SIZE[0] / 2
-    kolmion_sivu = cos30 * DRAWING_SIZE[0]
-    point1 = (DRAWING_SIZE[0] / 2, DRAWING_SIZE[1])
-    point2 = ((DRAWING_SIZE[0] - kolmion_sivu) / 2, DRAWING_SIZE[1] - 1.5 * radius)
-    point3 = (
-        DRAWING_SIZE[0] - (DRAWING_SIZE[0] - kolmion_sivu) / 2,
-        DRAWING_SIZE[1] - 1.5 * radius,
-    )
-    points = [point1, point2, point3]
+    # circle = get_circle(CENTER, radius)  #Helper circle
 
-    polygon = svgwrite.shapes.Polygon(
-        points, fill="none", stroke="black", stroke_width=STROKE_WIDTH
-    )
-    dwg.add(polygon)
-    dwg.attribs["height"] += STROKE_WIDTH
-    return dwg
+    polygon = get_polygon(TRIANGLE_POINTS)
+    return get_drawing(TRIANGLE_DRAWING_SIZE, [polygon])
 
 
 def hp_icon():
     """Icon for puristinheijari -kairaus."""
-    dwg = svgwrite.Drawing(size=DRAWING_SIZE.tolist())
-    cos30 = 3**0.5 / 2
-    radius = DRAWING_SIZE[0] / 2
-    kolmion_sivu = cos30 * DRAWING_SIZE[0]
-    point1 = (DRAWING_SIZE[0] / 2, DRAWING_SIZE[1])
-    point2 = ((DRAWING_SIZE[0] - kolmion_sivu) / 2, DRAWING_SIZE[1] - 1.5 * radius)
-    point3 = (
-        DRAWING_SIZE[0] - (DRAWING_SIZE[0] - kolmion_sivu) / 2,
-        DRAWING_SIZE[1] - 1.5 * radius,
-    )
-    points = [point1, point2, point3]
-
-    polygon = svgwrite.shapes.Polygon(
-        points, fill="none", stroke="black", stroke_width=STROKE_WIDTH
-    )
-    dwg.add(polygon)
-
-    radius = cos30 * (kolmion_sivu / 3)
-    circle = svgwrite.shapes.Circle(
-        center=(DRAWING_SIZE / 2).tolist(),
-        r=radius,
-        fill="none",
-        stroke="black",
-        stroke_width=STROKE_WIDTH,
-    )
-    dwg.add(circle)
-
-    point1 = (DRAWING_SIZE[0] / 2 - radius, DRAWING_SIZE[1] / 2)
-    point2 = (DRAWING_SIZE[0] / 2, DRAWING_SIZE[1] / 2 - radius)
-    arc = get_arc(point2, point1, radius, width=1e-5, fill="black")
-    point3 = (DRAWING_SIZE / 2).tolist()
-    arc.push("L {} {}".format(point3[0], point3[1]))
-    dwg.add(arc)
-    dwg.attribs["height"] += STROKE_WIDTH
-    return dwg
+    radius = TRIANGLE_INNER_RADIUS
+    elements = [
+        get_polygon(TRIANGLE_POINTS),
+        get_circle(CENTER, radius),
+        get_filled_quadrant(CENTER, radius),
+    ]
+    return get_drawing(TRIANGLE_DRAWING_SIZE, elements)
 
 
 def he_icon():
     """Icon for heijarikairaus."""
-    dwg = svgwrite.Drawing(size=DRAWING_SIZE.tolist())
-    # cos30 = 3 ** 0.5 / 2
-    # radius = DRAWING_SIZE[0] / 2
-    # kolmion_sivu = cos30 * DRAWING_SIZE[0]
-    # point1 = (DRAWING_SIZE[0] / 2, DRAWING_SIZE[1])
-    # point2 = ((DRAWING_SIZE[0] - kolmion_sivu) / 2, DRAWING_SIZE[1] - 1.5 * radius)
-    # point3 = (
-    #    DRAWING_SIZE[0] - (DRAWING_SIZE[0] - kolmion_sivu) / 2,
-    #    DRAWING_SIZE[1] - 1.5 * radius,
-    # )
-    # points = [point1, point2, point3]
-
-    # pl = svgwrite.shapes.Polygon(points, fill="none", stroke="black", stroke_width=STROKE_WIDTH)
-    # dwg.add(pl)
+    # pl = get_polygon(TRIANGLE_POINTS)
 
     radius = DRAWING_SIZE[0] / 2 - STROKE_WIDTH
-    circle = svgwrite.shapes.Circle(
-        center=(DRAWING_SIZE / 2).tolist(),
-        r=radius,
-        fill="none",
-        stroke="black",
-        stroke_width=STROKE_WIDTH,
-    )
-    dwg.add(circle)
-
-    point1 = (DRAWING_SIZE[0] / 2 - radius, DRAWING_SIZE[1] / 2)
-    point2 = (DRAWING_SIZE[0] / 2, DRAWING_SIZE[1] / 2 - radius)
-    arc = get_arc(point2, point1, radius, width=1e-5, fill="black")
-    point3 = (DRAWING_SIZE / 2).tolist()
-    arc.push("L {} {}".format(point3[0], point3[1]))
-    dwg.add(arc)
-    return dwg
+    elements = [get_circle(CENTER, radius), get_filled_quadrant(CENTER, radius)]
+    return get_drawing(DRAWING_SIZE, elements)
 
 
 def pt_icon():
     """Icon for putkikairaus."""
-    dwg = svgwrite.Drawing(size=DRAWING_SIZE.tolist())
-    cos30 = 3**0.5 / 2
-    radius = DRAWING_SIZE[0] / 2
-    kolmion_sivu = cos30 * DRAWING_SIZE[0]
-    point1 = (DRAWING_SIZE[0] / 2, DRAWING_SIZE[1])
-    point2 = ((DRAWING_SIZE[0] - kolmion_sivu) / 2, DRAWING_SIZE[1] - 1.5 * radius)
-    point3 = (
-        DRAWING_SIZE[0] - (DRAWING_SIZE[0] - kolmion_sivu) / 2,
-        DRAWING_SIZE[1] - 1.5 * radius,
-    )
-    points = [point1, point2, point3]
-
-    polygon = svgwrite.shapes.Polygon(
-        points, fill="none", stroke="black", stroke_width=STROKE_WIDTH
-    )
-    dwg.add(polygon)
-
-    radius = cos30 * (kolmion_sivu / 3)
-    circle = svgwrite.shapes.Circle(
-        center=(DRAWING_SIZE / 2).tolist(),
-        r=radius,
-        fill="none",
-        stroke="black",
-        stroke_width=STROKE_WIDTH,
-    )
-    dwg.add(circle)
-
-    dwg.attribs["height"] += STROKE_WIDTH
-    return dwg
+    polygon = get_polygon(TRIANGLE_POINTS)
+    circle = get_circle(CENTER, TRIANGLE_INNER_RADIUS)
+    return get_drawing(TRIANGLE_DRAWING_SIZE, [polygon, circle])
 
 
 def si_icon():
     """Icon for siipikairaus."""
-    dwg = svgwrite.Drawing(size=DRAWING_SIZE.tolist())
-
     circle_shrink = 4 / 5
     radius = (DRAWING_SIZE[0] / 2) * circle_shrink
-    circle = svgwrite.shapes.Circle(
-        center=(DRAWING_SIZE / 2).tolist(),
-        r=radius,
-        fill="none",
-        stroke="black",
-        stroke_width=STROKE_WIDTH,
-    )
-    dwg.add(circle)
-
-    dist_to_mid = (2**0.5) * DRAWING_SIZE[0] / 2
-    point1 = [0, 0]
-    point2 = ((dist_to_mid - radius) / 2**0.5, (dist_to_mid - radius) / 2**0.5)
-    points = [point1, point2]
-    polygon = svgwrite.shapes.Polygon(
-        points, fill="none", stroke="black", stroke_width=STROKE_WIDTH
-    )
-    dwg.add(polygon)
-
-    point1 = [DRAWING_SIZE[0], 0]
-    point2 = (
-        DRAWING_SIZE[0] - (dist_to_mid - radius) / 2**0.5,
-        (dist_to_mid - radius) / 2**0.5,
-    )
-    points = [point1, point2]
-    polygon = svgwrite.shapes.Polygon(
-        points, fill="none", stroke="black", stroke_width=STROKE_WIDTH
-    )
-    dwg.add(polygon)
-
-    point1 = [DRAWING_SIZE[0], DRAWING_SIZE[1]]
-    point2 = (
-        DRAWING_SIZE[0] - (dist_to_mid - radius) / 2**0.5,
-        DRAWING_SIZE[1] - (dist_to_mid - radius) / 2**0.5,
-    )
-    points = [point1, point2]
-    polygon = svgwrite.shapes.Polygon(
-        points, fill="none", stroke="black", stroke_width=STROKE_WIDTH
-    )
-    dwg.add(polygon)
-
-    point1 = [0, DRAWING_SIZE[1]]
-    point2 = (
-        (dist_to_mid - radius) / 2**0.5,
-        DRAWING_SIZE[1] - (dist_to_mid - radius) / 2**0.5,
+    elements = [get_circle(CENTER, radius)]
+
+    offset = (DIST_TO_MID - radius) / 2**0.5
+    segments = [
+        ((0, 0), (offset, offset)),
+        ((DRAWING_SIZE[0], 0), (DRAWING_SIZE[0] - offset, offset)),
+        ((DRAWING_SIZE[0], DRAWING_SIZE[1]), (DRAWING_SIZE[0] - offset, DRAWING_SIZE[1] - offset)),
+        ((0, DRAWING_SIZE[1]), (offset, DRAWING_SIZE[1] - offset)),
+    ]
+    command = " ".join(
+        f"M {start[0]:g},{start[1]:g} L {end[0]:g},{end[1]:g}" for start, end in segments
     )
-    points = [point1, point2]
-    polygon = svgwrite.shapes.Polygon(
-        points, fill="none", stroke="black", stroke_width=STROKE_WIDTH
-    )
-    dwg.add(polygon)
+    elements.append(get_path(command, width=STROKE_WIDTH, fill="none"))
 
     # Note edge line cut off
-    # dwg.attribs["height"] += STROKE_WIDTH
-    # dwg.attribs["width"] += STROKE_WIDTH
-    return dwg
+    # size = (DRAWING_SIZE[0] + STROKE_WIDTH, DRAWING_SIZE[1] + STROKE_WIDTH)
+    return get_drawing(DRAWING_SIZE, elements)
 
 
 def no_icon():
     """Icon for häiritty näytteenotto."""
-    width = DRAWING_SIZE[0] * STRECH_LARGE
-    dwg = svgwrite.Drawing(size=(DRAWING_SIZE * STRECH_LARGE).tolist())
+    width = LARGE_SIZE[0]
 
     radius = (width / 2) - STROKE_WIDTH
-    circle = svgwrite.shapes.Circle(
-        center=(DRAWING_SIZE * STRECH_LARGE / 2).tolist(),
-        r=radius,
-        fill="none",
-        stroke="black",
-        stroke_width=STROKE_WIDTH,
-    )
-    dwg.add(circle)
+    circle1 = get_circle(LARGE_CENTER, radius)
 
     circle_shrink = 3.5 / 5
     radius = (width / 2) * circle_shrink
-    circle = svgwrite.shapes.Circle(
-        center=(DRAWING_SIZE * STRECH_LARGE / 2).tolist(),
-        r=radius,
-        fill="none",
-        stroke="black",
-        stroke_width=STROKE_WIDTH,
-    )
-    dwg.add(circle)
-    return dwg
+    circle2 = get_circle(LARGE_CENTER, radius)
+    return get_drawing(LARGE_SIZE, [circle1, circle2])
 
 
 def ne_icon():
     """Icon for häiriintymätön näytteenotto."""
-    width = DRAWING_SIZE[0] * STRECH_LARGE
-    dwg = svgwrite.Drawing(size=(DRAWING_SIZE * STRECH_LARGE).tolist())
+    width = LARGE_SIZE[0]
 
     radius = (width / 2) - STROKE_WIDTH
-    circle = svgwrite.shapes.Circle(
-        center=(DRAWING_SIZE * STRECH_LARGE / 2).tolist(),
-        r=radius,
-        fill="none",
-        stroke="black",
-        stroke_width=STROKE_WIDTH,
-    )
-    dwg.add(circle)
+    elements = [get_circle(LARGE_CENTER, radius)]
 
     circle_shrink = 3.5 / 5
     radius = (width / 2) * circle_shrink
-    circle = svgwrite.shapes.Circle(
-        center=(DRAWING_SIZE * STRECH_LARGE / 2).tolist(),
-        r=radius,
-        fill="none",
-        stroke="black",
-        stroke_width=STROKE_WIDTH,
-    )
-    dwg.add(circle)
+    elements.append(get_circle(LARGE_CENTER, radius))
 
     point1 = [STROKE_WIDTH, width / 2]
     point2 = [width - STROKE_WIDTH, width / 2]
-    arc = get_arc(point1, point2, radius, width=1e-9, stroke="none", fill="black")
+    command = get_arc_command(point1, point2, radius)
 
+    # Inner arc continues from the line end, no move command needed
     point3 = (width / 2 + radius, width / 2)
-    arc.push("L {} {}".format(point3[0], point3[1]))
-
     point4 = (width / 2 - radius, width / 2)
-    arc_arg = get_arc_command(point3, point4, radius, sweep=1)
+    command += (
+        f" L {point3[0]} {point3[1]}"
+        f" a {radius:f},{radius:f} 0.000000 0,1 {point4[0] - point3[0]:f},{point4[1] - point3[1]:f}"
+    )
 
-    arc.push(arc_arg)
-    dwg.add(arc)
-    return dwg
+    elements.append(get_path(command, width=1e-9, stroke="none", fill="black"))
+    return get_drawing(LARGE_SIZE, elements)
 
 
 def vo_icon():
     """Icon for orsivesiputki."""
     width = DRAWING_SIZE[0]
     height = DRAWING_SIZE[1] * HIGH_ICONS_HEIGHT_STRECH
-    dwg = svgwrite.Drawing(size=(width, height))
 
     radius1 = (width / 2) - STROKE_WIDTH
     center1 = (width / 2, 3 * height / 4)
-    circle = svgwrite.shapes.Circle(
-        center=center1,
-        r=radius1,
-        fill="none",
-        stroke="black",
-        stroke_width=STROKE_WIDTH,
-    )
-    dwg.add(circle)
+    circle1 = get_circle(center1, radius1)
 
     radius2 = (width / 2) * 0.30
     center2 = (width / 2, height / 4)
-    circle = svgwrite.shapes.Circle(
-        center=center2,
-        r=radius2,
-        fill="black",
-        stroke="black",
-        stroke_width=STROKE_WIDTH,
-    )
-    dwg.add(circle)
+    circle2 = get_circle(center2, radius2, fill="black")
 
     point1 = (width / 2, center1[1] - radius1)
     point2 = (width / 2, center2[1] + radius2)
-    line = svgwrite.shapes.Line(point1, point2, stroke="black", stroke_width=STROKE_WIDTH)
-    dwg.add(line)
-    # dwg.add(
-    #    svgwrite.shapes.Circle((width / 2, height / 2),
-    #    stroke="red", stroke_width=STROKE_WIDTH * 4)
-    # )
-    return dwg
+    line = get_line(point1, point2)
+    # helper = get_circle((width / 2, height / 2), STROKE_WIDTH * 4)
+    return get_drawing((width, height), [circle1, circle2, line])
 
 
 def vp_icon():
     """Icon for pohjavesiputki."""
     width = DRAWING_SIZE[0]
     height = DRAWING_SIZE[1] * HIGH_ICONS_HEIGHT_STRECH
-    dwg = svgwrite.Drawing(size=(width, height))
 
     radius1 = (width / 2) - STROKE_WIDTH
     center1 = (width / 2, 3 * height / 4)
-    circle = svgwrite.shapes.Circle(
-        center=center1,
-        r=radius1,
-        fill="none",
-        stroke="black",
-        stroke_width=STROKE_WIDTH,
-    )
-    dwg.add(circle)
+    circle1 = get_circle(center1, radius1)
 
     radius2 = (width / 2) * 0.30
     center2 = (width / 2, height / 4)
-    circle = svgwrite.shapes.Circle(
-        center=center2,
-        r=radius2,
-        fill="none",
-        stroke="black",
-        stroke_width=STROKE_WIDTH,
-    )
-    dwg.add(circle)
+    circle2 = get_circle(center2, radius2)
 
     point1 = (width / 2, center1[1] - radius1)
     point2 = (width / 2, center2[1] + radius2)
-    line = svgwrite.shapes.Line(point1, point2, stroke="black", stroke_width=STROKE_WIDTH)
-    dwg.add(line)
-    # dwg.add(
-    #    svgwrite.shapes.Circle((width / 2, height / 2),
-    #    stroke="red", stroke_width=STROKE_WIDTH * 4)
-    # )
-    return dwg
+    line = get_line(point1, point2)
+    # helper = get_circle((width / 2, height / 2), STROKE_WIDTH * 4)
+    return get_drawing((width, height), [circle1, circle2, line])
 
 
 FUNCTIONS = {
@@ -559,15 +387,62 @@ FUNCTIONS = {
 }
 
 
-def main():
-    """Run all functions and save by hole abbreviation."""
+@lru_cache(maxsize=None)
+def get_function_svg(function):
+    """Return svg string built by icon function, aliases share one build."""
+    return function()
+
+
+def get_icon_svg(abbreviation):
+    """Return svg string of the icon for abbreviation, icons are built only once."""
+    return get_function_svg(FUNCTIONS[abbreviation])
+
+
+def save_icons(abbreviations):
+    """Save icon svg files of abbreviations sharing one icon function to current path.
+
+    Returns the abbreviations.
+    """
+    svg = (XML_HEADER + get_icon_svg(abbreviations[0])).encode("utf-8")
+    for abbreviation in abbreviations:
+        Path(abbreviation.replace("/", "_") + ".svg").write_bytes(svg)
+    return abbreviations
+
+
+def save_icons_json():
+    """Save svg strings of all icons to ICONS_FILE, read by plot_map with one file open."""
+    icons = {abb: XML_HEADER + get_icon_svg(abb) for abb in FUNCTIONS}
+    with open(ICONS_FILE, "w", encoding="utf-8") as f:
+        json.dump(icons, f, ensure_ascii=False, indent=0, sort_keys=True)
+
+
+def main(parallel=True):
+    """Run all functions and save by hole abbreviation.
+
+    Each icon function is run once and its svg saved for all its aliases.
+    Icons are saved in a process pool, serially if `parallel` is False
+    or processes can not be started on the platform.
+    """
     print("Printing icons.")
+    groups = {}
+    for abb, function in FUNCTIONS.items():
+        groups.setdefault(function, []).append(abb)
+    groups = list(groups.values())
+    saved = None
+    if parallel:
+        try:
+            with ProcessPoolExecutor() as executor:
+                saved = list(executor.map(save_icons, groups))
+        except (OSError, NotImplementedError):
+            saved = None
+    if saved is None:
+        saved = [save_icons(abbreviations) for abbreviations in groups]
+    saved = {abb for abbreviations in saved for abb in abbreviations}
     for abb in FUNCTIONS:
-        func = FUNCTIONS[abb]
-        name = ABBREVIATIONS[abb]
-        icon = func()
-        icon.saveas(abb.replace("/", "_") + ".svg")
-        print(name, "saved.")
+        if abb in saved:
+            print(ABBREVIATIONS[abb], "saved.")
+    save_icons_json()
+    print(ICONS_FILE, "saved.")
     # import os
     # import cairosvg
     # conda install cairo
@@ -1,209 +1,252 @@
 """Plot a html folium map from holes object."""
-from itertools import cycle
+import html
+import json
+import re
+from functools import lru_cache
 from pathlib import Path
 
-import folium
 import numpy as np
-from folium.plugins import MarkerCluster, MeasureControl, MousePosition
 from tqdm.auto import tqdm
 
-from ..core import Holes
 from ..core.coord_utils import coord_str_recognize, project_points
 from ..core.utils import ABBREVIATIONS
-from .holes import plot_hole
+from .holes import plot_many
 
 __all__ = ["plot_map"]
 
-
-def plot_map(holes, render_holes=True, progress_bar=True, popup_size=(3, 3)):
-    """Plot a leaflet map from holes with popup hole plots.
-
-    Parameters
-    ----------
-    holes : holes object
-    render_holes : bool
-        Render popup diagrams for holes
-    progress_bar : bool
-        Show tqdm progress bar while adding/rendering holes
-    popup_size : tuple
-        size in inches of popup figure
-
-    Returns
-    -------
-    map_fig : folium map object
-    """
-    holes_filtered = []
-    first_system = False
-    if len(holes) == 0:
-        raise ValueError("Can't plot empty holes -object.")
-    for hole in holes:
-        if hasattr(hole, "header") and hasattr(hole.header, "XY"):
-            if "X" in hole.header.XY and "Y" in hole.header.XY:
-                holes_filtered.append(hole)
-                coord_system = hole.fileheader.KJ["Coordinate system"]
-                input_epsg = coord_str_recognize(coord_system)
-                if "unknown" in input_epsg.lower():
-                    msg = "Coordinate system {} is unrecognized format / unknown name"
-                    msg = msg.format(coord_system)
-                    raise ValueError(msg)
-                if not first_system:
-                    first_system = coord_system
-                else:
-                    if not first_system == coord_system:
-                        raise ValueError("Coordinate system is not uniform in holes -object")
-    holes_filtered = Holes(holes_filtered)
-
-    x_all, y_all = [], []
-    for i in holes_filtered:
-        x_all.append(i.header["XY"]["X"])
-        y_all.append(i.header["XY"]["Y"])
-
-    x, y = np.mean(x_all), np.mean(y_all)
-    x, y = project_points(x, y, input_epsg)
-    max_zoom = 22
-    map_fig = folium.Map(
-        location=[x, y],
-        zoom_start=14,
-        max_zoom=22,
-        prefer_canvas=True,
-        control_scale=True,
-        tiles=None,
-    )
-    folium.TileLayer("OpenStreetMap", maxNativeZoom=19, maxZoom=max_zoom).add_to(map_fig)
-    folium.TileLayer("Stamen Terrain", maxNativeZoom=18, maxZoom=max_zoom).add_to(map_fig)
-    folium.TileLayer("CartoDB positron", maxNativeZoom=18, maxZoom=max_zoom).add_to(map_fig)
-    esri_url = (
-        "https://server.arcgisonline.com/ArcGIS/rest/services/"
-        + "World_Imagery/MapServer/tile/{z}/{y}/{x}"
-    )
-    folium.TileLayer(
-        tiles=esri_url,
+ICON_DIR = Path(__file__).parent / "icons"
+CLUSTER_MIN_HOLES = 20  # smaller maps with popup diagrams are not clustered
+SVG_SIZE_PATTERN = re.compile(r'\s(width|height)="([\d.]+)"')
+COLORS = [
+    "red",
+    "blue",
+    "green",
+    "purple",
+    "orange",
+    "darkred",
+    "lightred",
+    "darkblue",
+    "darkgreen",
+    "cadetblue",
+    "darkpurple",
+    "pink",
+    "lightblue",
+    "lightgreen",
+]
+GTK_WMS_URL = (
+    "http://gtkdata.gtk.fi/arcgis/services/Rajapinnat/GTK_Maapera_WMS/MapServer/WMSServer?"
+)
+# basemap name: folium.TileLayer kwargs, or folium.WmsTileLayer kwargs when "url" is given
+BASEMAPS = {
+    "OpenStreetMap": dict(tiles="OpenStreetMap", maxNativeZoom=19),
+    "Stamen Terrain": dict(tiles="Stamen Terrain", maxNativeZoom=18),
+    "CartoDB positron": dict(tiles="CartoDB positron", maxNativeZoom=18),
+    "Esri Satellite": dict(
+        tiles=(
+            "https://server.arcgisonline.com/ArcGIS/rest/services/"
+            + "World_Imagery/MapServer/tile/{z}/{y}/{x}"
+        ),
         attr="Esri",
         name="Esri Satellite",
         overlay=False,
         control=True,
         maxNativeZoom=18,
-        maxZoom=max_zoom,
-    ).add_to(map_fig)
-    mml_url_perus = "http://tiles.kartat.kapsi.fi/peruskartta/{z}/{x}/{y}.jpg"
-    mml_url_orto = "http://tiles.kartat.kapsi.fi/ortokuva/{z}/{x}/{y}.jpg"
-    folium.TileLayer(
-        tiles=mml_url_perus,
+    ),
+    "MML peruskartta": dict(
+        tiles="http://tiles.kartat.kapsi.fi/peruskartta/{z}/{x}/{y}.jpg",
         attr="MML",
         name="MML peruskartta",
         overlay=False,
         control=True,
         maxNativeZoom=18,
-        maxZoom=max_zoom,
-    ).add_to(map_fig)
-    folium.TileLayer(
-        tiles=mml_url_orto,
+    ),
+    "MML ilmakuva": dict(
+        tiles="http://tiles.kartat.kapsi.fi/ortokuva/{z}/{x}/{y}.jpg",
         attr="MML",
         name="MML ilmakuva",
         overlay=False,
         control=True,
         maxNativeZoom=18,
-        maxZoom=max_zoom,
-    ).add_to(map_fig)
-
-    gtk_url = (
-        "http://gtkdata.gtk.fi/arcgis/services/Rajapinnat/GTK_Maapera_WMS/MapServer/WMSServer?"
-    )
-    folium.WmsTileLayer(
+    ),
+    "GTK Maaperäkartta": dict(
         name="GTK Maaperäkartta",
-        url=gtk_url,
+        url=GTK_WMS_URL,
         fmt="image/png",
         layers=["maapera_100k_kerrostumat_ja_muodostumat"],  # "maapera_200k_maalajit"
         show=False,
         transparent=True,
         opacity=0.5,
-    ).add_to(map_fig)
-
-    folium.WmsTileLayer(
+    ),
+    "GTK Sulfaattimaat": dict(
         name="GTK Sulfaattimaat",
-        url=gtk_url,
+        url=GTK_WMS_URL,
         fmt="image/png",
         layers=["happamat_sulfaattimaat_250k_alueet"],
         show=False,
         transparent=True,
         opacity=0.5,
-    ).add_to(map_fig)
+    ),
+}
+DEFAULT_BASEMAPS = ("OpenStreetMap", "Esri Satellite")
 
-    sw_bounds = project_points(min(x_all), min(y_all), input_epsg)
-    ne_bounds = project_points(max(x_all), max(y_all), input_epsg)
 
-    map_fig.fit_bounds([sw_bounds, ne_bounds])
+def plot_map(
+    holes,
+    render_holes=True,
+    progress_bar=True,
+    popup_size=(3, 3),
+    n_jobs=1,
+    path=None,
+    basemaps=None,
+):
+    """Plot a leaflet map from holes with popup hole plots.
 
-    cluster = MarkerCluster(
-        control=False,
-        options=dict(
-            animate=True, maxClusterRadius=15, showCoverageOnHover=False, disableClusteringAtZoom=20
-        ),
-    ).add_to(map_fig)
-    map_fig.add_child(cluster)
-    hole_clusters = {}
-    colors = [
-        "red",
-        "blue",
-        "green",
-        "purple",
-        "orange",
-        "darkred",
-        "lightred",
-        "darkblue",
-        "darkgreen",
-        "cadetblue",
-        "darkpurple",
-        "pink",
-        "lightblue",
-        "lightgreen",
-    ]
-    colors = cycle(colors)
-    clust_icon_kwargs = {}
-    for color, key in zip(colors, holes_filtered.value_counts().keys()):
-        hole_clusters[key] = folium.plugins.FeatureGroupSubGroup(
-            cluster, name=ABBREVIATIONS.get(key, "Unrecognize abbreviation"), show=True
-        )
-        clust_icon_kwargs[key] = dict(color=color, icon="")
-        map_fig.add_child(hole_clusters[key])
+    Parameters
+    ----------
+    holes : holes object
+    render_holes : bool
+        Render popup diagrams for holes
+    progress_bar : bool
+        Show tqdm progress bar while adding/rendering holes
+    popup_size : tuple
+        size in inches of popup figure
+    n_jobs : int or None
+        Number of processes rendering popup diagrams, None or -1 uses all cpus.
+    path : str or path, optional
+        Save the map html to path and return None, large maps are then
+        not kept in memory or displayed in notebooks.
+    basemaps : str or list of str, optional
+        Names of the map layers added to the map, the first one is shown
+        initially. Possible values are the keys of BASEMAPS, defaults to
+        DEFAULT_BASEMAPS. Use BASEMAPS to add all layers.
+
+    Returns
+    -------
+    map_fig : folium map object or None
+    """
+    # folium is imported only for maps, it is slow to import
+    import folium
+    from folium.plugins import FeatureGroupSubGroup, MarkerCluster, MeasureControl, MousePosition
+
+    if len(holes) == 0:
+        raise ValueError("Can't plot empty holes -object.")
+    # one pass over holes collects everything needed for the markers
+    holes_filtered, keys, x_all, y_all, coord_systems = [], [], [], [], set()
+    clust_icon_kwargs, labels = {}, {}
+    for hole in holes:
+        if not (
+            hasattr(hole, "header")
+            and hasattr(hole.header, "XY")
+            and "X" in hole.header.XY
+            and "Y" in hole.header.XY
+        ):
+            continue
+        holes_filtered.append(hole)
+        x_all.append(hole.header.XY["X"])
+        y_all.append(hole.header.XY["Y"])
+        coord_systems.add(hole.fileheader.KJ["Coordinate system"])
+        if hasattr(hole.header, "TT") and "Survey abbreviation" in hole.header.TT:
+            key = hole.header.TT["Survey abbreviation"]
+        else:
+            key = "Missing survey abbreviation"
+        keys.append(key)
+        if key not in clust_icon_kwargs:
+            # colors in order of first appearance of abbreviations, same as Holes.value_counts
+            color = COLORS[len(clust_icon_kwargs) % len(COLORS)]
+            clust_icon_kwargs[key] = dict(color=color, icon="")
+            labels[key] = ABBREVIATIONS.get(key, f"Unrecognize abbreviation {key}")
+    if len(coord_systems) > 1:
+        raise ValueError("Coordinate system is not uniform in holes -object")
+    if not coord_systems:
+        raise ValueError("Can't plot holes without coordinates.")
+    coord_system = coord_systems.pop()
+    input_epsg = coord_str_recognize(coord_system)
+    if "unknown" in input_epsg.lower():
+        msg = "Coordinate system {} is unrecognized format / unknown name"
+        msg = msg.format(coord_system)
+        raise ValueError(msg)
+
+    x_all = np.array(x_all, dtype=float)
+    y_all = np.array(y_all, dtype=float)
+    # project hole points together with map center, south-west and north-east corners
+    x_projected, y_projected = project_points(
+        np.append(x_all, [x_all.mean(), x_all.min(), x_all.max()]),
+        np.append(y_all, [y_all.mean(), y_all.min(), y_all.max()]),
+        input_epsg,
+    )
+    (x, sw_x, ne_x), (y, sw_y, ne_y) = x_projected[-3:].tolist(), y_projected[-3:].tolist()
+    x_projected, y_projected = x_projected[:-3], y_projected[:-3]
+    max_zoom = 22
+    map_fig = folium.Map(
+        location=[x, y],
+        zoom_start=14,
+        max_zoom=22,
+        prefer_canvas=True,
+        control_scale=True,
+        tiles=None,
+    )
+    if isinstance(basemaps, str):
+        basemaps = [basemaps]
+    for name in DEFAULT_BASEMAPS if basemaps is None else basemaps:
+        if name not in BASEMAPS:
+            msg = "Unknown basemap {}, possible values are {}".format(name, list(BASEMAPS))
+            raise ValueError(msg)
+        layer_kwargs = BASEMAPS[name]
+        if "url" in layer_kwargs:
+            folium.WmsTileLayer(**layer_kwargs).add_to(map_fig)
+        else:
+            folium.TileLayer(**layer_kwargs, maxZoom=max_zoom).add_to(map_fig)
+
+    map_fig.fit_bounds([(sw_x, sw_y), (ne_x, ne_y)])
+
+    cluster_options = dict(
+        animate=True, maxClusterRadius=15, showCoverageOnHover=False, disableClusteringAtZoom=20
+    )
+    locations = list(zip(x_projected.tolist(), y_projected.tolist()))
 
     if progress_bar:
         pbar = tqdm(
             total=len(holes_filtered),
             desc="Rendering holes" if render_holes else "Adding points to map",
         )
-    for i, hole in enumerate(holes_filtered):
-        x, y = [hole.header.XY["X"], hole.header.XY["Y"]]
-        x, y = project_points(x, y, input_epsg)
+    if not render_holes:
+        # without popup diagrams markers are created in the browser
+        add_fast_markers(map_fig, keys, locations, labels, clust_icon_kwargs, cluster_options)
+        if progress_bar:
+            pbar.update(len(keys))
+    else:
+        # few markers are not clustered, leaflet.markercluster is then left out of the map
+        if len(keys) >= CLUSTER_MIN_HOLES:
+            cluster = MarkerCluster(control=False, options=cluster_options).add_to(map_fig)
+            map_fig.add_child(cluster)
+        hole_clusters = {}
+        for key in clust_icon_kwargs:
+            name = ABBREVIATIONS.get(key, "Unrecognize abbreviation")
+            if len(keys) >= CLUSTER_MIN_HOLES:
+                hole_clusters[key] = FeatureGroupSubGroup(cluster, name=name, show=True)
+            else:
+                hole_clusters[key] = folium.FeatureGroup(name=name, show=True)
+            map_fig.add_child(hole_clusters[key])
 
-        if hasattr(hole.header, "TT") and "Survey abbreviation" in hole.header["TT"]:
-            key = hole.header["TT"]["Survey abbreviation"]
-        else:
-            key = "Missing survey abbreviation"
-        if render_holes and key != "Missing survey abbreviation":
-            try:
-                hole_svg = plot_hole(hole, output="svg", figsize=popup_size)
-                popup = folium.Popup(hole_svg)
-                icon = get_icon(key, clust_icon_kwargs)
-                folium.Marker(location=[x, y], popup=popup, icon=icon).add_to(hole_clusters[key])
-
-            except (NotImplementedError, KeyError, TypeError):
-                icon = get_icon(key, clust_icon_kwargs)
-                folium.Marker(
-                    location=[x, y],
-                    popup=ABBREVIATIONS[key] + " " + str(i),
-                    icon=icon,
-                ).add_to(hole_clusters[key])
-        else:
+        # popups share the figure templates of plot_many, rendered lazily in the loop
+        rendered = (
+            hole for hole, key in zip(holes_filtered, keys) if key != "Missing survey abbreviation"
+        )
+        hole_svgs = plot_many(rendered, output="svg", figsize=popup_size, n_jobs=n_jobs)
+        for i, (key, location) in enumerate(zip(keys, locations)):
+            hole_svg = None
+            if key != "Missing survey abbreviation":
+                hole_svg = next(hole_svgs)
+            if hole_svg is None:
+                popup = labels[key] + " " + str(i)
+            else:
+                # svg is parsed in the browser only when the marker is first clicked
+                popup = folium.Popup(hole_svg, lazy=True)
             icon = get_icon(key, clust_icon_kwargs)
-            folium.Marker(
-                location=[x, y],
-                popup=ABBREVIATIONS.get(key, f"Unrecognize abbreviation {key}") + " " + str(i),
-                icon=icon,
-            ).add_to(hole_clusters[key])
+            folium.Marker(location=location, popup=popup, icon=icon).add_to(hole_clusters[key])
 
-        if progress_bar:
-            pbar.update(1)
+            if progress_bar:
+                pbar.update(1)
 
     folium.LayerControl().add_to(map_fig)
     MeasureControl(
@@ -220,32 +263,100 @@ def plot_map(holes, render_holes=True, progress_bar=True, popup_size=(3, 3)):
         lat_formatter=fmtr,
         lng_formatter=fmtr,
     ).add_to(map_fig)
+    if path is not None:
+        map_fig.save(path)
+        return None
     return map_fig
 
 
+@lru_cache(maxsize=None)
+def read_icons():
+    """Read all prebuilt icon svg strings from /icons/icons.json.
+
+    Icons are created with icons/hole_icons.py and shipped as package data.
+
+    Returns
+    -------
+    dict
+        {abbreviation: svg_str}
+    """
+    with open(ICON_DIR / "icons.json", "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def read_icon_svg(abbreviation):
+    """Get prebuilt icon svg string and its size, None if icon is missing.
+
+    Returns
+    -------
+    tuple or None
+        (svg_str, width, height)
+    """
+    svg_str = read_icons().get(abbreviation)
+    if svg_str is None:
+        return None
+    svg_tag = svg_str[svg_str.index("<svg") :].split(">", 1)[0]
+    size = dict(SVG_SIZE_PATTERN.findall(svg_tag))
+    return svg_str, float(size["width"]), float(size["height"])
+
+
 def get_icon(abbreviation, clust_icon_kwargs, default=False):
     """Get icon from /icons or create colored default folium icon."""
+    import folium
+
     if default:
         return folium.Icon(**clust_icon_kwargs[abbreviation])
-    path = Path(__file__).parent
-
-    icon_path = "icons//{abb}.svg".format(abb=abbreviation.replace("//", "_"))
-    # print(path/icon_path, path)
-    # print(abbreviation)
-    try:
-        with open(path / icon_path, "r") as f:
-            svg_str = f.read()
-    except FileNotFoundError:
+    icon_svg = read_icon_svg(abbreviation)
+    if icon_svg is None:
         return folium.Icon(**clust_icon_kwargs[abbreviation])
-    height = float(
-        [line for line in svg_str.split() if line.startswith("height")][0]
-        .split("=")[-1]
-        .replace('"', "")
-    )
-    width = float(
-        [line for line in svg_str.split() if line.startswith("width")][0]
-        .split("=")[-1]
-        .replace('"', "")
-    )
+    svg_str, width, height = icon_svg
     icon = folium.DivIcon(html=svg_str, icon_anchor=(width / 2, height / 2))
     return icon
+
+
+def add_fast_markers(map_fig, keys, locations, labels, clust_icon_kwargs, cluster_options):
+    """Add hole markers with text popups as browser rendered clusters, one per abbreviation.
+
+    Marker data is passed as a plain list to FastMarkerCluster, no folium Marker
+    or Icon objects are created per hole. Each abbreviation is clustered separately
+    and can be toggled in the layer control. Popup texts are html escaped, the
+    callback sets them as popup html.
+    """
+    from folium.plugins import FastMarkerCluster
+
+    popups = {key: html.escape(labels[key]) + " " for key in clust_icon_kwargs}
+    rows = {key: [] for key in clust_icon_kwargs}
+    for i, (key, location) in enumerate(zip(keys, locations)):
+        rows[key].append([*location, popups[key] + str(i)])
+    for key, data in rows.items():
+        FastMarkerCluster(
+            data,
+            callback=get_marker_callback(key, clust_icon_kwargs),
+            name=ABBREVIATIONS.get(key, "Unrecognize abbreviation"),
+            options=cluster_options,
+        ).add_to(map_fig)
+
+
+def get_marker_callback(abbreviation, clust_icon_kwargs):
+    """Get javascript FastMarkerCluster callback creating markers with the abbreviation icon.
+
+    Rows are [lat, lon, popup_text], the icon is created once and shared by the markers.
+    """
+    import folium
+
+    icon = get_icon(abbreviation, clust_icon_kwargs)
+    if isinstance(icon, folium.DivIcon):
+        icon_js = "L.divIcon({})".format(json.dumps(icon.options))
+    else:
+        icon_js = "L.AwesomeMarkers.icon({})".format(json.dumps(icon.options))
+    return (
+        "(function () {\n"
+        "    var icon = " + icon_js + ";\n"
+        "    return function (row) {\n"
+        "        var marker = L.marker(new L.LatLng(row[0], row[1]), {icon: icon});\n"
+        "        marker.bindPopup(row[2]);\n"
+        "        return marker;\n"
+        "    };\n"
+        "})()"
+    )
@@ -54,6 +54,6 @@ setup(
     ],
     keywords="infraformat",
     packages=find_packages(exclude=["docs", "tests"]),
-    package_data={"pyinfraformat": ["plots//icons//*.svg"]},
+    package_data={"pyinfraformat": ["plots//icons//*.svg", "plots//icons//*.json"]},
     install_requires=get_requirements(),
 )
@@ -0,0 +1,13 @@
+import os
+
+import pytest
+
+from pyinfraformat import from_infraformat
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(HERE, "test_data")
+
+
+@pytest.fixture(scope="session")
+def sample_holes():
+    return from_infraformat(os.path.join(DATA_DIR, "infraformat_hole_types.tek"))
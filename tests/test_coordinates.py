@@ -1,4 +1,3 @@
-import os
 from copy import deepcopy
 from glob import glob
 from uuid import uuid4
@@ -6,7 +5,7 @@ from uuid import uuid4
 import numpy as np
 import pytest
 
-from pyinfraformat import Holes, from_infraformat
+from pyinfraformat import Holes
 from pyinfraformat.core.coord_utils import (
     check_hole_in_country,
     coord_str_recognize,
@@ -21,13 +20,6 @@ from pyinfraformat.core.coord_utils import (
 )
 
 
-def get_object():
-    here = os.path.dirname(os.path.abspath(__file__))
-    filepath = os.path.join(here, "test_data", "infraformat_hole_types.tek")
-    object = from_infraformat(filepath)
-    return object
-
-
 @pytest.mark.parametrize(
     "strings",
     [("WGS84", "WGS 84"), ("Gk25", "ETRS89 / GK25FIN"), ("TM35FIN", "ETRS89 / TM35FIN(E,N)")],
@@ -38,16 +30,14 @@ def test_fix_coord_str(strings):
     assert output_str == correct
 
 
-def test_holes_projection_uniform():
-    holes = get_object()
-    holes = project_holes(holes)
+def test_holes_projection_uniform(sample_holes):
+    holes = project_holes(sample_holes)
     l = [hole.fileheader.KJ["Coordinate system"] for hole in holes]
     assert all([l[0] == i for i in l])
 
 
-def test_holes_coordinate_projection():
-    holes = get_object()
-    holes = flip_xy(holes)
+def test_holes_coordinate_projection(sample_holes):
+    holes = flip_xy(sample_holes)
     holes = flip_xy(holes)
     hole = holes[0]
     hole = flip_xy(hole)
@@ -63,8 +53,8 @@ def test_holes_coordinate_projection():
     assert check_hole_in_country(holes3, country="EE") == False
 
 
-def test_hole_coordinate_projection():
-    holes = get_object()
+def test_hole_coordinate_projection(sample_holes):
+    holes = deepcopy(sample_holes)
     hole = holes[5]
     hole.header.XY["X"] = 28837.457
     hole.header.XY["Y"] = 47640.142
@@ -73,8 +63,8 @@ def test_hole_coordinate_projection():
     assert check_hole_in_country(hole, country="FI")
 
 
-def test_holes_projection_errors():
-    holes = get_object()
+def test_holes_projection_errors(sample_holes):
+    holes = deepcopy(sample_holes)
     with pytest.raises(Exception) as e_info:
         project_holes("Wrong input")
     assert str(e_info.value) == "holes -parameter is unknown input type"
@@ -91,7 +81,7 @@ def test_holes_projection_errors():
     with pytest.raises(Exception) as e_info:
         flip_xy("Wrong input")
 
-    holes2 = get_object()
+    holes2 = deepcopy(sample_holes)
     holes_all = holes + holes2.project("Ykj")
     with pytest.raises(Exception) as e_info:
         check_hole_in_country(holes_all, "FI")
@@ -100,8 +90,8 @@ def test_holes_projection_errors():
     check_hole_in_country(holes2.project("WGS84"), "FI")
 
 
-def test_holes_projection_errors2():
-    holes = get_object()
+def test_holes_projection_errors2(sample_holes):
+    holes = deepcopy(sample_holes)
     hole = holes[2]
     del hole.header.XY["X"]
     del hole.header.XY["Y"]
@@ -109,26 +99,26 @@ def test_holes_projection_errors2():
         project_hole(hole, output_epsg="EPSG:4326")
     assert str(e_info.value) == "Hole has no coordinates"
 
-    holes = get_object()
+    holes = deepcopy(sample_holes)
     del holes[0].header.XY["X"]
     del holes[0].header.XY["Y"]
     holes2 = project_holes(holes)
     assert len(holes) > len(holes2)
 
-    holes = get_object()
+    holes = deepcopy(sample_holes)
     del holes[1].fileheader.KJ["Coordinate system"]  # del all pointers
     holes2 = project_holes(holes)  # holes2 is empty
     assert len(holes) > len(holes2)
 
-    holes = get_object()
+    holes = deepcopy(sample_holes)
     holes[2].header.XY["X"] = np.nan
     holes[2].header.XY["Y"] = np.nan
     holes2 = project_holes(holes)
     assert len(holes) > len(holes2)
 
 
-def test_holes_projection_errors3():
-    holes = get_object()
+def test_holes_projection_errors3(sample_holes):
+    holes = deepcopy(sample_holes)
     hole = holes[5]
     hole.fileheader.KJ["Coordinate system"] = "UnknownString"
     with pytest.raises(Exception) as e_info:
@@ -136,8 +126,8 @@ def test_holes_projection_errors3():
     assert "Internal Proj Error" in str(e_info.value)
 
 
-def test_holes_projection_errors4():
-    holes = get_object()
+def test_holes_projection_errors4(sample_holes):
+    holes = deepcopy(sample_holes)
     hole = holes[5]
     hole.fileheader.KJ["Coordinate system"] = "UnknownString"
     with pytest.raises(Exception) as e_info:
@@ -218,9 +208,9 @@ def test_proj_helsinki(coords):
 def test_proj_porvoo():
     input_coords = (0, 0)
     *output_coords, epsg = proj_porvoo(*input_coords)
-    assert type(output_coords[0]) == float
-    assert type(output_coords[1]) == float
-    assert type(epsg) == str
+    assert isinstance(output_coords[0], float)
+    assert isinstance(output_coords[1], float)
+    assert isinstance(epsg, str)
 
 
 @pytest.mark.parametrize(
@@ -258,8 +248,8 @@ def test_height_system_errors():
     height_systems_diff(np.array([1, 2]), "N2000", "N2000")
 
 
-def test_height_holes():
-    holes = get_object()
+def test_height_holes(sample_holes):
+    holes = deepcopy(sample_holes)
     hole = holes[7]
     hole.fileheader.KJ["Height reference"] = "N43"  # pointer to all holes
     holes2 = project_holes(holes, output_height="N2000")
@@ -1,7 +1,5 @@
 import os
-from glob import glob
 from io import BytesIO, StringIO
-from uuid import uuid4
 
 import pytest
 
@@ -16,31 +14,48 @@ from pyinfraformat import (
 
 from .helpers import ping_gtk
 
+HERE = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(HERE, "test_data")
+
 
 def get_datafiles(quality=None, encoding=None):
-    here = os.path.dirname(os.path.abspath(__file__))
-    data_directory = os.path.join(here, "test_data", "*.tek")
-    datafiles = glob(data_directory)
-    if isinstance(quality, str) and quality.lower() == "bad":
-        # use regex here
-        datafiles = [path for path in datafiles if "_bad" in path]
-    elif isinstance(quality, str) and quality.lower() == "good":
-        # use regex here
-        datafiles = [path for path in datafiles if "_bad" not in path]
-
-    if isinstance(encoding, str) and encoding.lower() == "utf-16":
-        datafiles = [path for path in datafiles if "utf16" in path]
-    elif isinstance(encoding, str) and encoding.lower() == "ascii":
-        datafiles = [path for path in datafiles if "utf16" not in path]
-    return datafiles
-
-
-@pytest.mark.parametrize("errors", ["raise", "ignore_lines", "ignore_holes"])
-def test_reading_good(errors):
-    for path in get_datafiles("good"):
-        holes = from_infraformat(path, errors=errors)
-        assert isinstance(holes, Holes)
-        assert isinstance(holes.holes, list)
+    quality = quality.lower() if isinstance(quality, str) else None
+    encoding = encoding.lower() if isinstance(encoding, str) else None
+    datafiles = []
+    with os.scandir(DATA_DIR) as entries:
+        for entry in entries:
+            path = entry.path
+            if not entry.name.endswith(".tek") or not entry.is_file():
+                continue
+            if quality == "bad" and "_bad" not in path:
+                continue
+            if quality == "good" and "_bad" in path:
+                continue
+            if encoding == "utf-16" and "utf16" not in path:
+                continue
+            if encoding == "ascii" and "utf16" in path:
+                continue
+            datafiles.append(path)
+    return sorted(datafiles)
+
+
+@pytest.fixture(scope="session", params=get_datafiles("good"), ids=os.path.basename)
+def good_holes(request):
+    # each good file is parsed once with the default errors="ignore_lines"
+    return from_infraformat(request.param)
+
+
+def test_reading_good(good_holes):
+    assert isinstance(good_holes, Holes)
+    assert isinstance(good_holes.holes, list)
+
+
+@pytest.mark.parametrize("path", get_datafiles("good"), ids=os.path.basename)
+@pytest.mark.parametrize("errors", ["raise", "ignore_holes"])
+def test_reading_good_errors(errors, path):
+    holes = from_infraformat(path, errors=errors)
+    assert isinstance(holes, Holes)
+    assert isinstance(holes.holes, list)
 
 
 @pytest.mark.parametrize("errors", ["raise", "ignore_lines", "ignore_holes", "force"])
@@ -78,53 +93,54 @@ def test_reading_good_bytesio(errors):
         assert isinstance(holes.holes, list)
 
 
-def test_reading_bad():
-    for path in get_datafiles("bad"):
-        with pytest.raises(Exception):
-            from_infraformat(path, errors="raise")
+@pytest.mark.parametrize("path", get_datafiles("bad"), ids=os.path.basename)
+def test_reading_bad(path):
+    with pytest.raises(Exception):
+        from_infraformat(path, errors="raise")
+
+
+def test_reading_missing_path():
     with pytest.raises(Exception):
         from_infraformat("../ImaginaryFolder")
 
 
+@pytest.mark.parametrize("path", get_datafiles(None, "utf-16"), ids=os.path.basename)
 @pytest.mark.parametrize("encoding", ["utf-8", "ascii"])
-def test_reading_bad_encoding(encoding):
-    for path in get_datafiles(None, "utf-16"):
-        with pytest.raises(UnicodeDecodeError):
-            from_infraformat(path, errors="raise", encoding=encoding)
+def test_reading_bad_encoding(encoding, path):
+    with pytest.raises(UnicodeDecodeError):
+        from_infraformat(path, errors="raise", encoding=encoding)
 
 
-def test_reading_bad_stringio():
-    for path in get_datafiles("bad"):
-        with StringIO() as text:
-            with open(path, "r") as f:
-                text.write(f.read())
-            text.seek(0)
-            with pytest.raises(Exception):
-                from_infraformat(text, errors="raise")
+@pytest.mark.parametrize("path", get_datafiles("bad"), ids=os.path.basename)
+def test_reading_bad_stringio(path):
+    with StringIO() as text:
+        with open(path, "r") as f:
+            text.write(f.read())
+        text.seek(0)
+        with pytest.raises(Exception):
+            from_infraformat(text, errors="raise")
 
 
-def test_reading_bad_bytesio():
-    for path in get_datafiles("bad"):
-        with BytesIO() as text:
-            with open(path, "rb") as f:
-                text.write(f.read())
-            text.seek(0)
-            with pytest.raises(Exception):
-                from_infraformat(text, errors="raise")
+@pytest.mark.parametrize("path", get_datafiles("bad"), ids=os.path.basename)
+def test_reading_bad_bytesio(path):
+    with BytesIO() as text:
+        with open(path, "rb") as f:
+            text.write(f.read())
+        text.seek(0)
+        with pytest.raises(Exception):
+            from_infraformat(text, errors="raise")
 
 
 def test_reading_dir():
-    here = os.path.dirname(os.path.abspath(__file__))
-    data_directory = os.path.join(here, "test_data")
     paths_read = []
     try:
-        path_read = from_infraformat(data_directory)
+        path_read = from_infraformat(DATA_DIR)
     except:
         # this just tests that one of the files is read correctly.
         pass
 
-    path_read = from_infraformat(data_directory, extension=".tek2")
-    path_read = from_infraformat(data_directory, extension="tek2")
+    path_read = from_infraformat(DATA_DIR, extension=".tek2")
+    path_read = from_infraformat(DATA_DIR, extension="tek2")
 
 
 def test_reading_empty():
@@ -151,46 +167,39 @@ def test_gtk_wfs():
     assert len(holes) == 3
 
 
-def test_output():
-    for path in get_datafiles("good"):
-        holes = from_infraformat(path)
-        assert isinstance(holes, Holes)
-        if len(holes.holes) > 0:
-            here = os.path.dirname(os.path.abspath(__file__))
-            output_path = os.path.join(here, "test_data", str(uuid4()) + "_output_example.csv")
-            assert not os.path.exists(output_path)
-            holes.to_csv(output_path)
-            assert os.path.exists(output_path)
-            os.remove(output_path)
-            assert not os.path.exists(output_path)
-
-            output_path = os.path.join(here, "test_data", str(uuid4()) + "_output_example")
-            with pytest.raises(FileExtensionMissingError):
-                holes.to_csv(output_path)
-
-            output_path = os.path.join(here, "test_data", str(uuid4()) + "_output_example.xlsx")
-            assert not os.path.exists(output_path)
-            holes.to_excel(output_path)
-            assert os.path.exists(output_path)
-            os.remove(output_path)
-            assert not os.path.exists(output_path)
-
-            output_path = os.path.join(here, "test_data", str(uuid4()) + "_output_example")
-            with pytest.raises(FileExtensionMissingError):
-                holes.to_excel(output_path)
-
-            output_path = os.path.join(here, "test_data", str(uuid4()) + "_output_example.tek")
-            assert not os.path.exists(output_path)
-            holes.to_infraformat(output_path)
-            assert os.path.exists(output_path)
-            os.remove(output_path)
-            assert not os.path.exists(output_path)
-
-            with StringIO() as output_io:
-                output_io.seek(0)
-                holes.to_infraformat(output_io)
-                output_io.seek(0)
-                assert len(output_io.read())
+def test_output(good_holes, tmp_path):
+    holes = good_holes
+    if not holes.holes:
+        pytest.skip("no holes to write")
+    output_path = tmp_path / "output_example.csv"
+    holes.to_csv(output_path)
+    assert output_path.exists()
+
+    output_path = tmp_path / "output_example"
+    with pytest.raises(FileExtensionMissingError):
+        holes.to_csv(output_path)
+
+    output_path = tmp_path / "output_example.xlsx"
+    holes.to_excel(output_path)
+    assert output_path.exists()
+
+    output_path = tmp_path / "output_example"
+    with pytest.raises(FileExtensionMissingError):
+        holes.to_excel(output_path)
+
+    output_path = tmp_path / "output_example.tek"
+    holes.to_infraformat(output_path)
+    assert output_path.exists()
+
+    with StringIO() as output_io:
+        holes.to_csv(output_io)
+        assert len(output_io.getvalue())
+
+    with StringIO() as output_io:
+        output_io.seek(0)
+        holes.to_infraformat(output_io)
+        output_io.seek(0)
+        assert len(output_io.read())
 
 
 def test_set_logger():
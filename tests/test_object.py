@@ -1,4 +1,3 @@
-import os
 from glob import glob
 from uuid import uuid4
 
@@ -8,57 +7,48 @@ from pyinfraformat import (
     FileExtensionMissingError,
     Holes,
     PathNotFoundError,
-    from_infraformat,
 )
 
 
-def get_object():
-    here = os.path.dirname(os.path.abspath(__file__))
-    filepath = os.path.join(here, "test_data", "infraformat_hole_types.tek")
-    object = from_infraformat(filepath)
-    return object
-
-
-def test_str():
-    holes = get_object()
+def test_str(sample_holes):
+    holes = sample_holes
     assert len(holes.__str__().splitlines()) == 38
 
 
-def test_repr():
-    holes = get_object()
+def test_repr(sample_holes):
+    holes = sample_holes
     assert len(holes.__repr__().splitlines()) == 38
     hole = holes[0]
     assert len(repr(hole.fileheader)) > 10
 
 
-def test_iteration():
-    holes = get_object()
+def test_iteration(sample_holes):
+    holes = sample_holes
     for hole in holes:
         assert bool(hole)
 
 
-def test_subobject_str():
-    holes = get_object()
+def test_subobject_str(sample_holes):
+    holes = sample_holes
     hole = holes[0]
     assert len(hole.__str__().splitlines()) > 40
 
 
-def test_subobject_repr():
-    holes = get_object()
+def test_subobject_repr(sample_holes):
+    holes = sample_holes
     hole = holes[0]
     assert len(hole.__repr__().splitlines()) > 40
 
 
-def test_subobject_pandas():
-    holes = get_object()
+def test_subobject_pandas(sample_holes):
+    holes = sample_holes
     hole = holes[0]
     assert hole.get_dataframe().shape == (6, 52)
 
 
-def test_object_pandas():
-    holes = get_object()
+def test_object_pandas(sample_holes):
+    holes = sample_holes
     assert holes.get_dataframe().shape == (246, 101)
-    holes = get_object()
     columns = ["*lab*", "*sieve*", "*header*"]
     assert holes.get_dataframe(skip_columns=columns).shape == (246, 40)
     assert holes.get_dataframe(include_columns=columns).shape == (48, 61)
@@ -68,14 +58,14 @@ def test_object_pandas():
     )
 
 
-def test_drop_duplicates():
-    holes = get_object()
+def test_drop_duplicates(sample_holes):
+    holes = sample_holes
     with pytest.raises(NotImplementedError):
         holes.drop_duplicates()
 
 
-def test_filter_by_date():
-    holes = get_object()
+def test_filter_by_date(sample_holes):
+    holes = sample_holes
     filtered_holes = holes.filter_holes(start="2014-05-18", end="2019-01-10", fmt="%Y-%m-%d")
     assert len(filtered_holes) <= len(holes)
 
@@ -84,22 +74,22 @@ def test_filter_by_date():
     assert len(filtered_holes) <= len(filtered_holes3)
 
 
-def test_filter_by_hole_type():
-    holes = get_object()
+def test_filter_by_hole_type(sample_holes):
+    holes = sample_holes
     filtered_holes = holes.filter_holes(hole_type=["PO"])
     filtered_holes2 = holes.filter_holes(hole_type="PO")
     assert len(filtered_holes) == len(filtered_holes2)
     assert len(filtered_holes) <= len(holes)
 
 
-def test_filter_by_coordinates():
-    holes = get_object()
+def test_filter_by_coordinates(sample_holes):
+    holes = sample_holes
     filtered_holes = holes.filter_holes(bbox=(24, 25, 60, 61))
     assert len(filtered_holes) <= len(holes)
 
 
-def test_append_extend_slices():
-    holes = get_object()
+def test_append_extend_slices(sample_holes):
+    holes = sample_holes
     holes2 = holes[:-1]
     one_hole = holes[-1]
     assert len(holes2 + one_hole) == len(holes)
@@ -121,7 +111,7 @@ def test_append_extend_slices():
         one_hole + "This is not a hole"
 
 
-def test_get_endings():
-    holes = get_object()
+def test_get_endings(sample_holes):
+    holes = sample_holes
     endings_df = holes.get_endings(False)
     assert len(endings_df) <= len(holes)
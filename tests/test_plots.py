@@ -1,25 +1,20 @@
-import os
+from copy import deepcopy
 from glob import glob
-from uuid import uuid4
 
 import folium
 import matplotlib.pyplot as plt
+import numpy as np
 import pytest
 
-from pyinfraformat import from_gtk_wfs, from_infraformat, plot_map
+from pyinfraformat import from_gtk_wfs, plot_hole, plot_many, plot_map
+from pyinfraformat.plots.holes import decimate
+from pyinfraformat.plots.maps import BASEMAPS
 
 from .helpers import ping_gtk
 
 
-def get_object():
-    here = os.path.dirname(os.path.abspath(__file__))
-    filepath = os.path.join(here, "test_data", "infraformat_hole_types.tek")
-    object = from_infraformat(filepath)
-    return object
-
-
-def test_holes_plot():
-    holes = get_object()
+def test_holes_plot(sample_holes):
+    holes = sample_holes
     for hole in holes:
         try:
             fig = hole.plot()
@@ -28,15 +23,127 @@ def test_holes_plot():
             pass
 
 
-def test_map():
-    holes = get_object()
+def test_decimate():
+    depths = np.linspace(0, 20, 10_000)
+    values = np.random.default_rng(0).uniform(0, 100, len(depths))
+    values[[10, 5000]] = [-1, 200]
+    values[100:200] = np.nan
+    decimated_values, decimated_depths = decimate(values, depths, 300)
+    assert len(decimated_values) == len(decimated_depths) <= 302
+    assert decimated_values.min() == -1 and decimated_values.max() == 200
+    assert decimated_depths[0] == 0 and decimated_depths[-1] == 20
+    assert np.all(np.diff(decimated_depths) > 0)
+    assert len(decimate(values[:10], depths[:10], 300)[0]) == 10
+    assert len(decimate(values, depths)[0]) == len(values)
+
+
+def test_plot_many(sample_holes):
+    holes = sample_holes
+    svgs = list(plot_many(holes))
+    assert len(svgs) == len(holes)
+    assert any(isinstance(svg, str) for svg in svgs)
+    assert None in svgs
+
+
+def test_plot_many_figures(sample_holes):
+    holes = sample_holes
+    n_figures = len(plt.get_fignums())
+    figures = list(plot_many(holes, output="figure"))
+    assert len(figures) == len(holes)
+    assert any(isinstance(fig, plt.Figure) for fig in figures)
+    assert len(plt.get_fignums()) == n_figures
+
+
+@pytest.mark.parametrize("pyplot", [None, True, False])
+def test_plot_hole_svg_closes_figures(sample_holes, pyplot):
+    n_figures = len(plt.get_fignums())
+    for hole in sample_holes:
+        try:
+            svg = plot_hole(hole, output="svg", pyplot=pyplot)
+        except (NotImplementedError, KeyError, TypeError):
+            continue
+        assert isinstance(svg, str)
+    assert len(plt.get_fignums()) == n_figures
+
+
+def test_plot_hole_style(sample_holes):
+    hole = sample_holes.filter_holes(hole_type="PO")[0]
+    svg = plot_hole(hole, output="svg")
+    with plt.rc_context({"axes.facecolor": "#ff0000", "axes.edgecolor": "#00ff00"}):
+        svg_styled = plot_hole(hole, output="svg")
+        fig = next(plot_many([hole], output="figure"))
+        assert fig.axes[0].get_facecolor() == (1.0, 0.0, 0.0, 1.0)
+    assert "#ff0000" not in svg and "#00ff00" not in svg
+    assert "#ff0000" in svg_styled and "#00ff00" in svg_styled
+    assert "#ff0000" not in plot_hole(hole, output="svg")
+
+
+def test_plot_many_duplicates(sample_holes):
+    holes = sample_holes
+    svgs = list(plot_many(holes + holes))
+    assert svgs[: len(holes)] == svgs[len(holes) :]
+
+
+def test_plot_many_parallel(sample_holes):
+    holes = sample_holes
+    svgs = list(plot_many(holes, n_jobs=2))
+    assert [svg is None for svg in svgs] == [svg is None for svg in plot_many(holes)]
+    with pytest.raises(ValueError):
+        plot_many(holes, output="figure", n_jobs=2)
+
+
+def test_map(sample_holes):
+    holes = sample_holes
+    holes_map = plot_map(holes)
+    assert isinstance(holes_map, folium.Map)
+
+
+def test_map_without_clusters(sample_holes):
+    holes = sample_holes[:5]
     holes_map = plot_map(holes)
     assert isinstance(holes_map, folium.Map)
+    html = holes_map.get_root().render()
+    assert "markerClusterGroup" not in html
+
+
+def test_map_without_popups(sample_holes):
+    holes = sample_holes
+    holes_map = plot_map(holes, render_holes=False)
+    assert isinstance(holes_map, folium.Map)
+    html = holes_map.get_root().render()
+    assert "markerClusterGroup" in html
+
+
+def test_map_without_popups_escapes_labels(sample_holes):
+    holes = deepcopy(sample_holes[:5])
+    holes[0].header.TT["Survey abbreviation"] = "<b>XX</b>"
+    html = plot_map(holes, render_holes=False).get_root().render()
+    # folium json encodes the marker data, & is written as \u0026
+    assert "\\u003cb\\u003eXX" not in html
+    assert "\\u0026lt;b\\u0026gt;XX" in html
+
+
+def test_map_basemaps(sample_holes):
+    holes = sample_holes[:5]
+    html = plot_map(holes, render_holes=False, basemaps="MML peruskartta").get_root().render()
+    assert "peruskartta" in html
+    assert "ortokuva" not in html
+    html = plot_map(holes, render_holes=False, basemaps=BASEMAPS).get_root().render()
+    assert "ortokuva" in html
+    with pytest.raises(ValueError):
+        plot_map(holes, basemaps=["Unknown basemap"])
+
+
+def test_map_to_file(sample_holes, tmp_path):
+    holes = sample_holes
+    output_path = tmp_path / "map.html"
+    assert holes.plot_map(render_holes=False, path=output_path) is None
+    assert output_path.exists()
 
 
 @pytest.mark.skipif(not ping_gtk(), reason="GTK DB not available")
-def test_gtk_map():
-    holes = get_object()
+def test_gtk_map(sample_holes):
+    holes = sample_holes
     holes_map = plot_map(holes)
     bbox = (60.12065, 24.4421945, 60.1208, 24.443)  # Bbox with empty and missing data holes
     holes = from_gtk_wfs(bbox, "WGS84")
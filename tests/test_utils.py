@@ -41,18 +41,11 @@ def test_info_bad(language):
         print_info(language)
 
 
-'''
-@pytest.mark.parametrize("nums", [("1", 1), ("1_000", 1000), ("0", 0)])
-def test_custom_int_pure(nums):
-    """Input string num and number pair"""
-    str_num, num = nums
-    custom_integer = custom_int(str_num)
-    assert custom_integer == num
-    assert isinstance(custom_integer, int)
-
-
-@pytest.mark.parametrize("nums", [("1.", 1), ("1_000,0", 1000), (".0", 0), ("1,0e3", 1000)])
-def test_custom_int_float(nums):
+@pytest.mark.parametrize(
+    "nums",
+    [("1", 1), ("1_000", 1000), ("0", 0), ("1.", 1), ("1_000,0", 1000), (".0", 0), ("1,0e3", 1000)],
+)
+def test_custom_int(nums):
     """Input string num and number pair"""
     str_num, num = nums
     custom_integer = custom_int(str_num)
@@ -72,10 +65,9 @@ def test_custom_int_to_float(nums):
 
 
 @pytest.mark.parametrize("num", ["-", "nan", "NaN", "NA", "test", "value", "1.2a"])
-def test_custom_int_to_nan(num):
-    custom_integer = custom_int(num)
-    assert isinstance(custom_integer, float)
-    assert np.isnan(custom_integer)
+def test_custom_int_bad(num):
+    with pytest.raises(ValueError):
+        custom_int(num)
 
 
 @pytest.mark.parametrize("nums", [("1", 1.0), ("1_000,2", 1000.2), ("1e3", 1e3)])
@@ -87,9 +79,14 @@ def test_custom_float(nums):
     assert not np.isnan(custom_floating)
 
 
-@pytest.mark.parametrize("num", ["-", "nan", "NaN", "NA", "test", "string", "1.2a"])
+@pytest.mark.parametrize("num", ["nan", "NaN"])
 def test_custom_float_to_nan(num):
     custom_floating = custom_float(num)
     assert isinstance(custom_floating, float)
     assert np.isnan(custom_floating)
-'''
+
+
+@pytest.mark.parametrize("num", ["-", "NA", "test", "string", "1.2a"])
+def test_custom_float_bad(num):
+    with pytest.raises(ValueError):
+        custom_float(num)